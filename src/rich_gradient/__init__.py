@@ -5,5 +5,23 @@ from rich_gradient.run import Run, run
 from rich_gradient.log import Log, log
 from rich_gradient.default_styles import DEFAULT_STYLES, get_log
 from rich_gradient.color import Color
-from rich_gradient.spectrum import Spectrum
+from rich_gradient.spectrum import (
+    RANDOM_GRADIENTS,
+    SPECTRUM,
+    RandomGradientSource,
+    Spectrum,
+    SpectrumView,
+)
 from rich_gradient.theme import GradientTheme, GRADIENT_TERMINAL_THEME
+from rich_gradient._ramp import (
+    RAMP_CACHE,
+    STYLE_CACHE,
+    configure_ramp_cache,
+    warm_ramp_cache,
+)
+from rich_gradient._quantize import QuantizeHook, install_quantizer
+from rich_gradient._stream import stream
+from rich_gradient._parallel import render_parallel
+from rich_gradient._animated import AnimatedGradient
+from rich_gradient._gradient2d import Gradient2D
+from rich_gradient._border import GradientPanel, GradientRule, GradientTable
@@ -0,0 +1,145 @@
+"""Animate a gradient by rotating it through a precomputed table of styles."""
+
+from __future__ import annotations
+
+from typing import Dict, List, Optional, Sequence
+
+from pydantic_extra_types.color import ColorType
+from rich.color import ColorSystem
+from rich.console import Console, ConsoleOptions, JustifyMethod, OverflowMethod
+from rich.control import strip_control_codes
+from rich.measure import Measurement
+from rich.style import Style, StyleType
+from rich.text import Span, Text
+
+from rich_gradient._ramp import (
+    cached_ramp,
+    color_style,
+    downgrade_styles,
+    gradient_stops,
+    quantized_color_system,
+    ramp_stops,
+)
+
+
+class AnimatedGradient:
+    """A gradient that shifts along its text each time it is rendered.
+
+    The colors are interpolated once into a cyclic table of interned styles, \
+returning to the first color at the end so the cycle wraps seamlessly. Each \
+frame only shifts an offset into that table, so rendering a frame costs one \
+table lookup per character and never parses a color. Use it with \
+`rich.live.Live` to animate titles.
+
+    Args:
+        text (str): The text to animate.
+        colors (Sequence[ColorType], optional): The colors of the gradient. \
+Defaults to None, which uses the first colors of the spectrum.
+        style (StyleType): A style applied beneath the gradient. Defaults to \
+`Style.null()`.
+        cycle_length (int, optional): The number of characters covered by one \
+cycle of the colors. Defaults to None, which uses the length of the text.
+        speed (int): The number of characters the gradient moves per frame. \
+Defaults to 1.
+        auto_advance (bool): Whether to move to the next frame after each \
+render. Defaults to True.
+        justify (JustifyMethod, optional): Justify method. Defaults to None.
+        overflow (OverflowMethod, optional): Overflow method. Defaults to None.
+        no_wrap (bool, optional): Disable wrapping. Defaults to None.
+    """
+
+    def __init__(
+        self,
+        text: str,
+        colors: Optional[Sequence[ColorType]] = None,
+        *,
+        style: StyleType = Style.null(),
+        cycle_length: Optional[int] = None,
+        speed: int = 1,
+        auto_advance: bool = True,
+        justify: Optional[JustifyMethod] = None,
+        overflow: Optional[OverflowMethod] = None,
+        no_wrap: Optional[bool] = None,
+    ) -> None:
+        color_stops = gradient_stops(colors)
+        self.text = strip_control_codes(text)
+        self.colors = color_stops
+        self.style = Style.parse(style) if isinstance(style, str) else style
+        self.cycle_length = max(cycle_length or len(self.text), 2)
+        self.speed = speed
+        self.auto_advance = auto_advance
+        self.justify = justify
+        self.overflow = overflow
+        self.no_wrap = no_wrap
+        self.phase = 0
+
+        stops = ramp_stops(color_stops)
+        ramp = cached_ramp((*stops, stops[0]), self.cycle_length)
+        table = [
+            color_style(red, green, blue, self.style)
+            for red, green, blue in ramp.tolist()
+        ]
+        self._tables: Dict[Optional[ColorSystem], List[Style]] = {None: table}
+
+    def __len__(self) -> int:
+        return len(self.text)
+
+    def advance(self, frames: int = 1) -> None:
+        """Move the gradient along the text.
+
+        Args:
+            frames (int): The number of frames to move. Defaults to 1.
+        """
+        self.phase = (self.phase + frames * self.speed) % self.cycle_length
+
+    def _table(self, color_system: Optional[ColorSystem] = None) -> List[Style]:
+        """The cyclic table of styles, downgraded once per color system."""
+        table = self._tables.get(color_system)
+        if table is None:
+            assert color_system is not None
+            table = downgrade_styles(self._tables[None], color_system)
+            self._tables[color_system] = table
+        return table
+
+    def frame(
+        self,
+        phase: Optional[int] = None,
+        color_system: Optional[ColorSystem] = None,
+    ) -> Text:
+        """Get a frame of the animation as a `Text`.
+
+        Args:
+            phase (int, optional): The offset into the table of styles. \
+Defaults to None, which uses the current phase.
+            color_system (ColorSystem, optional): A palette color system to \
+downgrade the colors to. Defaults to None, which keeps truecolor.
+
+        Returns:
+            Text: The colored text of the frame.
+        """
+        if phase is None:
+            phase = self.phase
+        table = self._table(color_system)
+        cycle_length = self.cycle_length
+        spans = [
+            Span(index, index + 1, table[(index - phase) % cycle_length])
+            for index in range(len(self.text))
+        ]
+        return Text(
+            self.text,
+            justify=self.justify,
+            overflow=self.overflow,
+            no_wrap=self.no_wrap,
+            spans=spans,
+        )
+
+    def __rich_console__(self, console: Console, options: ConsoleOptions):
+        text = self.frame(color_system=quantized_color_system(console))
+        if self.auto_advance:
+            self.advance()
+        yield text
+
+    def __rich_measure__(
+        self, console: Console, options: ConsoleOptions
+    ) -> Measurement:
+        return Measurement.get(console, options, Text(self.text))
@@ -0,0 +1,150 @@
+"""Encode gradient colors straight to ANSI escape sequences."""
+
+from __future__ import annotations
+
+from itertools import repeat
+from typing import Dict, Iterable, List, Optional, Union
+
+import numpy as np
+from rich.color import Color as RichColor
+from rich.color import ColorSystem
+from rich.console import COLOR_SYSTEMS
+from rich.style import Style
+
+from rich_gradient._cache import LRUCache
+from rich_gradient._ramp import (
+    QUANTIZED_SYSTEMS,
+    contrast_mask,
+    downgrade_color,
+    ramp_runs,
+)
+
+SGR_CACHE_SIZE: int = 4096
+SGR_CACHE: LRUCache[str] = LRUCache(maxsize=SGR_CACHE_SIZE)
+RESET: str = "\x1b[0m"
+COLOR_SYSTEM_NAMES: Dict[ColorSystem, str] = {
+    system: name for name, system in COLOR_SYSTEMS.items()
+}
+
+
+def color_system_of(
+    color_system: Union[ColorSystem, str, None],
+) -> Optional[ColorSystem]:
+    """Resolve a color system given by name, as `Console` accepts it.
+
+    Args:
+        color_system (ColorSystem | str, optional): A color system, or one \
+of "standard", "256", "truecolor" and "windows".
+
+    Returns:
+        Optional[ColorSystem]: The color system, or None for no color.
+    """
+    if color_system is None or isinstance(color_system, ColorSystem):
+        return color_system
+    try:
+        return COLOR_SYSTEMS[color_system]
+    except KeyError:
+        raise ValueError(f"Unknown color system: {color_system!r}") from None
+
+
+def color_sgr(
+    red: int,
+    green: int,
+    blue: int,
+    color_system: ColorSystem,
+    foreground: bool = True,
+) -> str:
+    """Get the SGR parameters selecting a foreground or background color.
+
+    The parameters are computed once per color and color system, and kept \
+in the process-wide `SGR_CACHE`.
+
+    Args:
+        red (int): The red component.
+        green (int): The green component.
+        blue (int): The blue component.
+        color_system (ColorSystem): The color system to encode for.
+        foreground (bool): Whether to select the foreground color, rather \
+than the background color. Defaults to True.
+
+    Returns:
+        str: The SGR parameters, e.g. "38;2;255;0;0".
+    """
+    key = (red, green, blue, color_system, foreground)
+    sgr = SGR_CACHE.get(key)
+    if sgr is None:
+        color = RichColor.from_rgb(red, green, blue)
+        if color_system in QUANTIZED_SYSTEMS:
+            color = downgrade_color(color, color_system)
+        sgr = SGR_CACHE.set(key, ";".join(color.get_ansi_codes(foreground=foreground)))
+    return sgr
+
+
+def encode_ansi(
+    text: str,
+    ramp: np.ndarray,
+    style: Style,
+    color_system: Optional[ColorSystem],
+    background: bool = False,
+) -> str:
+    """Encode a colored text to ANSI, without going through `Segment`s.
+
+    The base style's attributes are emitted once, then a color is emitted \
+only where it differs from the previous one, so runs of characters sharing a \
+color, or a palette entry, cost a single escape sequence. The foreground and \
+background of a background gradient are tracked apart, and only the one that \
+changed is emitted.
+
+    Args:
+        text (str): The text to encode.
+        ramp (np.ndarray): A `(len(text), 3)` array of RGB values.
+        style (Style): The base style, without a foreground color, or \
+without any color for a background gradient.
+        color_system (ColorSystem, optional): The color system to encode \
+for. None returns the text unchanged.
+        background (bool): Whether the ramp holds background colors, with \
+contrasting foregrounds as in `contrast_mask`. Defaults to False.
+
+    Returns:
+        str: The text with ANSI escape sequences.
+    """
+    if color_system is None or not text:
+        return text
+    base = style.without_color._make_ansi_codes(color_system)
+    if style.bgcolor is not None and not background:
+        bgcolor = style.bgcolor
+        if color_system in QUANTIZED_SYSTEMS:
+            bgcolor = downgrade_color(bgcolor, color_system)
+        bgcolor_sgr = ";".join(bgcolor.get_ansi_codes(foreground=False))
+        base = f"{base};{bgcolor_sgr}" if base else bgcolor_sgr
+
+    pieces: List[str] = [f"\x1b[{base}m"] if base else []
+    runs = ramp_runs(ramp).tolist()
+    run_colors = ramp[runs[:-1]]
+    darks: Iterable[Optional[bool]] = (
+        contrast_mask(run_colors).tolist() if background else repeat(None)
+    )
+    previous_foreground: Optional[str] = None
+    previous_background: Optional[str] = None
+    for (red, green, blue), dark, start, stop in zip(
+        run_colors.tolist(), darks, runs, runs[1:]
+    ):
+        background_sgr: Optional[str] = None
+        if dark is None:
+            foreground_sgr = color_sgr(red, green, blue, color_system)
+        else:
+            contrast = 0 if dark else 255
+            foreground_sgr = color_sgr(contrast, contrast, contrast, color_system)
+            background_sgr = color_sgr(red, green, blue, color_system, False)
+        changed: List[str] = []
+        if foreground_sgr != previous_foreground:
+            changed.append(foreground_sgr)
+            previous_foreground = foreground_sgr
+        if background_sgr is not None and background_sgr != previous_background:
+            changed.append(background_sgr)
+            previous_background = background_sgr
+        if changed:
+            pieces.append(f"\x1b[{';'.join(changed)}m")
+        pieces.append(text[start:stop])
+    pieces.append(RESET)
+    return "".join(pieces)
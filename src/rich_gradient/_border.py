@@ -0,0 +1,376 @@
+"""Color the borders of panels, rules and tables with a gradient."""
+
+from __future__ import annotations
+
+from copy import copy
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from pydantic_extra_types.color import ColorType
+from rich.cells import get_character_cell_size
+from rich.color import ColorSystem
+from rich.console import Console, ConsoleOptions, RenderableType, RenderResult
+from rich.panel import Panel
+from rich.rule import Rule
+from rich.segment import Segment
+from rich.style import Style, StyleType
+from rich.table import Table
+
+from rich_gradient._cache import LRUCache
+from rich_gradient._ramp import (
+    RGB,
+    Interpolation,
+    cached_ramp,
+    color_style,
+    downgrade_styles,
+    gradient_stops,
+    quantized_color_system,
+    ramp_stops,
+)
+
+BORDER_CACHE_SIZE: int = 128
+BORDER_CACHE: LRUCache[Tuple[Style, ...]] = LRUCache(maxsize=BORDER_CACHE_SIZE)
+BORDER_SEGMENT_CACHE_SIZE: int = 4096
+BORDER_SEGMENT_CACHE: LRUCache[Tuple[Segment, ...]] = LRUCache(
+    maxsize=BORDER_SEGMENT_CACHE_SIZE
+)
+
+# Marks the segments a renderable draws with its border style.
+_BORDER_KEY = "rich_gradient.border"
+BORDER_MARKER: Style = Style(meta={_BORDER_KEY: True})
+
+# The color stops, width, height, interpolation and color system of a border.
+BorderKey = Tuple[Tuple[RGB, ...], int, int, str, Optional[ColorSystem]]
+
+
+def perimeter_length(width: int, height: int) -> int:
+    """Get the number of cells around a box.
+
+    Args:
+        width (int): The width of the box, in cells.
+        height (int): The height of the box, in lines. A single line, such \
+as a rule, is colored from left to right.
+
+    Returns:
+        int: The number of cells along the box's edge.
+    """
+    if height <= 1:
+        return width
+    return 2 * width + 2 * (height - 2)
+
+
+def perimeter_index(row: int, column: int, width: int, height: int) -> int:
+    """Get the position of a border cell along the perimeter of a box.
+
+    The perimeter runs clockwise from the top left corner. Border cells inside \
+the box, such as the lines between the columns of a table, take the position \
+of the top border cell above them.
+
+    Args:
+        row (int): The line of the cell, from the top of the box.
+        column (int): The column of the cell, from the left of the box.
+        width (int): The width of the box, in cells.
+        height (int): The height of the box, in lines.
+
+    Returns:
+        int: The cell's position along the perimeter.
+    """
+    if row <= 0 or height <= 1:
+        return column
+    if row >= height - 1:
+        return width + (height - 2) + (width - 1 - column)
+    if column >= width - 1:
+        return width + row - 1
+    if column <= 0:
+        return 2 * width + (height - 2) + (height - 2 - row)
+    return column
+
+
+def border_styles(
+    stops: Tuple[RGB, ...],
+    width: int,
+    height: int,
+    interpolation: Interpolation = "rgb",
+) -> Tuple[Style, ...]:
+    """Get the style of every cell along the perimeter of a box.
+
+    The styles are computed once per `(stops, width, height, interpolation)` \
+and kept in the process-wide `BORDER_CACHE`.
+
+    Args:
+        stops (Tuple[RGB, ...]): The color stops, as returned by `ramp_stops`.
+        width (int): The width of the box, in cells.
+        height (int): The height of the box, in lines.
+        interpolation (Interpolation): The color space to interpolate in. \
+Defaults to "rgb".
+
+    Returns:
+        Tuple[Style, ...]: One style per cell, in the order of \
+`perimeter_index`.
+    """
+    key = (stops, width, height, interpolation)
+    styles = BORDER_CACHE.get(key)
+    if styles is None:
+        ramp = cached_ramp(stops, perimeter_length(width, height), interpolation)
+        styles = BORDER_CACHE.set(
+            key,
+            tuple(
+                color_style(red, green, blue, Style.null())
+                for red, green, blue in ramp.tolist()
+            ),
+        )
+    return styles
+
+
+def _unmark(style: Style) -> Style:
+    """Remove the border marker from a style, keeping any other meta."""
+    meta = dict(style.meta)
+    meta.pop(_BORDER_KEY, None)
+    unmarked = style.clear_meta_and_links()
+    if style.link or meta:
+        unmarked += Style(link=style.link, meta=meta or None)
+    return unmarked
+
+
+def _render_segments(
+    result: RenderResult, console: Console, options: ConsoleOptions
+) -> Iterable[Segment]:
+    """Render the output of a `__rich_console__` method to segments."""
+    for item in result:
+        if isinstance(item, Segment):
+            yield item
+        else:
+            yield from console.render(item, options)
+
+
+def color_border(
+    lines: List[List[Segment]],
+    stops: Tuple[RGB, ...],
+    interpolation: Interpolation = "rgb",
+    console: Optional[Console] = None,
+) -> List[List[Segment]]:
+    """Color the marked segments of rendered lines along a box's perimeter.
+
+    The box spans from the first to the last line holding a segment styled \
+with `BORDER_MARKER`, and is as wide as its first line. Each marked cell is \
+colored from `border_styles`, beneath the segment's own style, so colored \
+titles keep their colors. Recolored segments are kept in the process-wide \
+`BORDER_SEGMENT_CACHE`, so redrawing an unchanged border is a lookup per \
+segment.
+
+    Args:
+        lines (List[List[Segment]]): The rendered lines, without newlines.
+        stops (Tuple[RGB, ...]): The color stops, as returned by `ramp_stops`.
+        interpolation (Interpolation): The color space to interpolate in. \
+Defaults to "rgb".
+        console (Console, optional): The console the lines are rendered for. \
+Palette consoles get the nearest palette colors. Defaults to None.
+
+    Returns:
+        List[List[Segment]]: The lines, with their borders colored.
+    """
+
+    def is_marked(segment: Segment) -> bool:
+        style = segment.style
+        return (
+            style is not None
+            and not segment.control
+            and style._meta is not None
+            and _BORDER_KEY in style.meta
+        )
+
+    rows = [index for index, line in enumerate(lines) if any(map(is_marked, line))]
+    if not rows:
+        return lines
+    top, bottom = rows[0], rows[-1]
+    width = Segment.get_line_length(lines[top])
+    height = bottom - top + 1
+    color_system = quantized_color_system(console) if console is not None else None
+    key: BorderKey = (stops, width, height, interpolation, color_system)
+    styles: Optional[Sequence[Style]] = None
+    unmarked: Dict[Style, Style] = {}
+
+    colored: List[List[Segment]] = list(lines)
+    for row in range(height):
+        line: List[Segment] = []
+        column = 0
+        for segment in lines[top + row]:
+            text = segment.text
+            if not is_marked(segment):
+                line.append(segment)
+                column += segment.cell_length
+                continue
+            cache_key = (key, row, column, segment)
+            recolored = BORDER_SEGMENT_CACHE.get(cache_key)
+            if recolored is None:
+                if styles is None:
+                    styles = border_styles(stops, width, height, interpolation)
+                    if color_system is not None:
+                        styles = downgrade_styles(styles, color_system)
+                base = unmarked.get(segment.style)  # type: ignore[arg-type]
+                if base is None:
+                    base = unmarked[segment.style] = _unmark(  # type: ignore[index]
+                        segment.style  # type: ignore[arg-type]
+                    )
+                pieces: List[Segment] = []
+                offset = column
+                for character in text:
+                    index = perimeter_index(row, offset, width, height)
+                    style = styles[index % len(styles)] + base
+                    if pieces and pieces[-1].style == style:
+                        pieces[-1] = Segment(pieces[-1].text + character, style)
+                    else:
+                        pieces.append(Segment(character, style))
+                    offset += get_character_cell_size(character)
+                recolored = BORDER_SEGMENT_CACHE.set(cache_key, tuple(pieces))
+            line.extend(recolored)
+            column += segment.cell_length
+        colored[top + row] = line
+    return colored
+
+
+def _render_border(
+    renderable: Any,
+    render: Any,
+    border_attribute: str,
+    stops: Tuple[RGB, ...],
+    interpolation: Interpolation,
+    console: Console,
+    options: ConsoleOptions,
+) -> RenderResult:
+    """Render a copy of a renderable with a marked border, then color it."""
+    marked = copy(renderable)
+    border_style: Optional[StyleType] = getattr(renderable, border_attribute)
+    setattr(
+        marked,
+        border_attribute,
+        console.get_style(border_style or "").without_color + BORDER_MARKER,
+    )
+    segments = _render_segments(render(marked, console, options), console, options)
+    lines = list(Segment.split_lines(segments))
+    new_line = Segment.line()
+    for line in color_border(lines, stops, interpolation, console):
+        yield from line
+        yield new_line
+
+
+class GradientPanel(Panel):
+    """A `Panel` whose border is colored with a gradient.
+
+    The gradient runs clockwise around the panel from its top left corner. \
+The border style's color is replaced by the gradient; its other attributes, \
+such as bold, are kept.
+
+    Args:
+        renderable (RenderableType): The renderable inside the panel.
+        colors (Sequence[ColorType], optional): The colors of the border. \
+Defaults to None, which uses the first colors of the spectrum.
+        interpolation (Interpolation): The color space the colors blend in. \
+Defaults to "rgb".
+        **kwargs: The other arguments of `Panel`, e.g. `title` or `padding`.
+    """
+
+    def __init__(
+        self,
+        renderable: RenderableType,
+        colors: Optional[Sequence[ColorType]] = None,
+        *,
+        interpolation: Interpolation = "rgb",
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(renderable, **kwargs)
+        self.colors = gradient_stops(colors)
+        self.interpolation = interpolation
+
+    def __rich_console__(
+        self, console: Console, options: ConsoleOptions
+    ) -> RenderResult:
+        yield from _render_border(
+            self,
+            Panel.__rich_console__,
+            "border_style",
+            ramp_stops(self.colors),
+            self.interpolation,
+            console,
+            options,
+        )
+
+
+class GradientRule(Rule):
+    """A `Rule` whose line is colored with a gradient, from left to right.
+
+    Args:
+        title (str | Text): The text in the rule. Defaults to "".
+        colors (Sequence[ColorType], optional): The colors of the line. \
+Defaults to None, which uses the first colors of the spectrum.
+        interpolation (Interpolation): The color space the colors blend in. \
+Defaults to "rgb".
+        **kwargs: The other arguments of `Rule`, e.g. `characters` or \
+`align`.
+    """
+
+    def __init__(
+        self,
+        title: Any = "",
+        colors: Optional[Sequence[ColorType]] = None,
+        *,
+        interpolation: Interpolation = "rgb",
+        **kwargs: Any,
+    ) -> None:
+        kwargs.setdefault("style", Style.null())
+        super().__init__(title, **kwargs)
+        self.colors = gradient_stops(colors)
+        self.interpolation = interpolation
+
+    def __rich_console__(
+        self, console: Console, options: ConsoleOptions
+    ) -> RenderResult:
+        yield from _render_border(
+            self,
+            Rule.__rich_console__,
+            "style",
+            ramp_stops(self.colors),
+            self.interpolation,
+            console,
+            options,
+        )
+
+
+class GradientTable(Table):
+    """A `Table` whose border is colored with a gradient.
+
+    The gradient runs clockwise around the table from its top left corner; \
+the lines inside the table take the color of the top border above them. The \
+title and caption are not part of the border.
+
+    Args:
+        *headers (Column | str): The columns of the table.
+        colors (Sequence[ColorType], optional): The colors of the border. \
+Defaults to None, which uses the first colors of the spectrum.
+        interpolation (Interpolation): The color space the colors blend in. \
+Defaults to "rgb".
+        **kwargs: The other arguments of `Table`, e.g. `title` or `box`.
+    """
+
+    def __init__(
+        self,
+        *headers: Any,
+        colors: Optional[Sequence[ColorType]] = None,
+        interpolation: Interpolation = "rgb",
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(*headers, **kwargs)
+        self.colors = gradient_stops(colors)
+        self.interpolation = interpolation
+
+    def __rich_console__(
+        self, console: Console, options: ConsoleOptions
+    ) -> RenderResult:
+        yield from _render_border(
+            self,
+            Table.__rich_console__,
+            "border_style",
+            ramp_stops(self.colors),
+            self.interpolation,
+            console,
+            options,
+        )
@@ -0,0 +1,126 @@
+"""A small, thread-safe LRU cache with hit and miss counters."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from threading import Lock
+from typing import Callable, Generic, Hashable, NamedTuple, Optional, TypeVar
+
+CacheValue = TypeVar("CacheValue")
+
+
+class CacheInfo(NamedTuple):
+    """Statistics of an `LRUCache`, in the spirit of `functools.lru_cache`."""
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class LRUCache(Generic[CacheValue]):
+    """A bounded mapping that evicts the least recently used entries.
+
+    Args:
+        maxsize (int): The maximum number of entries. Defaults to 1024.
+    """
+
+    def __init__(self, maxsize: int = 1024) -> None:
+        if maxsize < 1:
+            raise ValueError("Cache size must be at least 1.")
+        self._maxsize = maxsize
+        self._data: OrderedDict[Hashable, CacheValue] = OrderedDict()
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._data
+
+    @property
+    def maxsize(self) -> int:
+        """The maximum number of entries."""
+        return self._maxsize
+
+    def get(self, key: Hashable) -> Optional[CacheValue]:
+        """Get an entry, marking it as recently used.
+
+        Args:
+            key (Hashable): The key of the entry.
+
+        Returns:
+            Optional[CacheValue]: The cached value, or None if it is missing.
+        """
+        with self._lock:
+            value = self._data.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: CacheValue) -> CacheValue:
+        """Store an entry, evicting the least recently used ones if full.
+
+        Args:
+            key (Hashable): The key of the entry.
+            value (CacheValue): The value to cache.
+
+        Returns:
+            CacheValue: The cached value.
+        """
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self._maxsize:
+                self._data.popitem(last=False)
+        return value
+
+    def get_or_set(
+        self, key: Hashable, factory: Callable[[], CacheValue]
+    ) -> CacheValue:
+        """Get an entry, computing and storing it with `factory` if missing.
+
+        Args:
+            key (Hashable): The key of the entry.
+            factory (Callable[[], CacheValue]): Computes the value on a miss.
+
+        Returns:
+            CacheValue: The cached value.
+        """
+        value = self.get(key)
+        if value is None:
+            value = self.set(key, factory())
+        return value
+
+    def resize(self, maxsize: int) -> None:
+        """Change the maximum number of entries, evicting if needed.
+
+        Args:
+            maxsize (int): The new maximum number of entries.
+        """
+        if maxsize < 1:
+            raise ValueError("Cache size must be at least 1.")
+        with self._lock:
+            self._maxsize = maxsize
+            while len(self._data) > maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove every entry and reset the counters."""
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def info(self) -> CacheInfo:
+        """Get the cache's statistics.
+
+        Returns:
+            CacheInfo: The hits, misses, maximum and current size.
+        """
+        return CacheInfo(self.hits, self.misses, self._maxsize, len(self._data))
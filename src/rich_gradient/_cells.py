@@ -0,0 +1,88 @@
+"""Map characters to the terminal columns they are displayed in."""
+
+from __future__ import annotations
+
+import unicodedata
+from typing import Tuple
+
+import numpy as np
+from rich.cells import get_character_cell_size
+
+ZERO_WIDTH_JOINER: int = 0x200D
+REGIONAL_INDICATORS: Tuple[int, int] = (0x1F1E6, 0x1F1FF)
+
+
+def _is_extender(code: int) -> bool:
+    """Whether a code point extends the grapheme cluster before it."""
+    return (
+        code == ZERO_WIDTH_JOINER
+        or 0xFE00 <= code <= 0xFE0F  # variation selectors
+        or 0x1F3FB <= code <= 0x1F3FF  # emoji skin tone modifiers
+        or 0xE0020 <= code <= 0xE007F  # emoji tag sequences
+        or unicodedata.combining(chr(code)) != 0
+        or unicodedata.category(chr(code)) in ("Mn", "Me")
+    )
+
+
+def cell_columns(plain: str) -> Tuple[np.ndarray, int]:
+    """Get the column each character is displayed at, and the total width.
+
+    Characters are grouped into grapheme clusters: combining marks, \
+variation selectors, skin tone modifiers and characters joined by a zero \
+width joiner belong to the cluster before them, and share its column, as \
+does the second of a pair of regional indicators, which together show a \
+flag. Each cluster is as wide as its first character, and a flag as wide as \
+its two indicators. Printable ASCII is one column \
+per character; the widths of other characters are looked up once per \
+distinct character.
+
+    Args:
+        plain (str): The text.
+
+    Returns:
+        Tuple[np.ndarray, int]: The column of each character, and the number \
+of columns the text spans.
+    """
+    length = len(plain)
+    if plain.isascii() and plain.isprintable():
+        return np.arange(length), length
+    if not length:
+        return np.zeros(0, dtype=np.int64), 0
+
+    codes = np.frombuffer(plain.encode("utf-32-le"), dtype=np.uint32)
+    widths = np.ones(length, dtype=np.int64)
+    extenders = np.zeros(length, dtype=bool)
+    other = (codes < 0x20) | (codes >= 0x7F)
+    unique, inverse = np.unique(codes[other], return_inverse=True)
+    if len(unique):
+        unique_codes = unique.tolist()
+        widths[other] = np.array(
+            [get_character_cell_size(chr(code)) for code in unique_codes],
+            dtype=np.int64,
+        )[inverse]
+        extenders[other] = np.array(
+            [_is_extender(code) for code in unique_codes], dtype=bool
+        )[inverse]
+
+    # A character after a zero width joiner continues the cluster, e.g. 👩‍💻.
+    joined = np.zeros(length, dtype=bool)
+    joined[1:] = codes[:-1] == ZERO_WIDTH_JOINER
+    # Regional indicators pair up into flags, e.g. 🇺🇸, from the start of a run.
+    first, last = REGIONAL_INDICATORS
+    regional = (codes >= first) & (codes <= last)
+    if regional.any():
+        positions = np.arange(length)
+        run_starts = np.where(regional & ~np.roll(regional, 1), positions, 0)
+        run_starts[0] = 0
+        paired = regional & ((positions - np.maximum.accumulate(run_starts)) % 2 == 1)
+        widths[np.flatnonzero(paired) - 1] += widths[paired]
+        extenders |= paired
+
+    starts = ~(extenders | joined)
+    starts[0] = True
+    widths[~starts] = 0
+
+    columns = np.cumsum(widths) - widths
+    clusters = np.cumsum(starts) - 1
+    columns = columns[np.flatnonzero(starts)][clusters]
+    return columns, int(widths.sum())
@@ -0,0 +1,203 @@
+"""Store a gradient's spans in flat arrays, and build `Span`s on demand."""
+
+from __future__ import annotations
+
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from rich.color import ColorSystem
+from rich.style import Style
+from rich.text import Span
+
+from rich_gradient._ramp import (
+    background_style,
+    color_style,
+    contrast_mask,
+    downgrade_styles,
+    ramp_runs,
+)
+
+
+class CompactSpans:
+    """The spans of a gradient, as arrays of offsets and palette indexes.
+
+    Each span takes twelve bytes: its start, its end and the index of its \
+style in a palette of interned styles, each an unsigned 32 bit integer. A \
+list of `Span`s costs a tuple, two integers and a list slot per span.
+
+    Args:
+        starts (np.ndarray): The start offset of each span.
+        ends (np.ndarray): The end offset of each span.
+        indexes (np.ndarray): The index of each span's style in `palette`.
+        palette (Sequence[Style]): The distinct styles of the spans.
+    """
+
+    __slots__ = ("starts", "ends", "indexes", "palette", "_quantized")
+
+    def __init__(
+        self,
+        starts: np.ndarray,
+        ends: np.ndarray,
+        indexes: np.ndarray,
+        palette: Sequence[Style],
+    ) -> None:
+        self.starts = np.asarray(starts, dtype=np.uint32)
+        self.ends = np.asarray(ends, dtype=np.uint32)
+        self.indexes = np.asarray(indexes, dtype=np.uint32)
+        self.palette: Tuple[Style, ...] = tuple(palette)
+        self._quantized: Dict[ColorSystem, CompactSpans] = {}
+
+    @classmethod
+    def from_ramp(
+        cls,
+        ramp: np.ndarray,
+        style: Style,
+        merge: bool = False,
+        offset: int = 0,
+        background: bool = False,
+    ) -> "CompactSpans":
+        """Build the spans of a color ramp, without creating `Span`s.
+
+        The spans are the same as those of `ramp_spans`, with the same \
+interned styles.
+
+        Args:
+            ramp (np.ndarray): A `(length, 3)` array of RGB values.
+            style (Style): The base style combined with each color.
+            merge (bool): Whether to merge consecutive characters with the \
+same color into a single span. Defaults to False.
+            offset (int): The position of the ramp's first character in the \
+text. Defaults to 0.
+            background (bool): Whether the colors are background colors, \
+with contrasting foregrounds. Defaults to False.
+
+        Returns:
+            CompactSpans: The spans.
+        """
+        if merge:
+            runs = ramp_runs(ramp)
+            colors = ramp[runs[:-1]]
+            starts = runs[:-1] + offset
+            ends = runs[1:] + offset
+        else:
+            colors = ramp
+            starts = np.arange(offset, offset + len(ramp))
+            ends = starts + 1
+        if not len(colors):
+            return cls.empty()
+
+        channels = colors.astype(np.uint32)
+        packed = channels[:, 0] << 16 | channels[:, 1] << 8 | channels[:, 2]
+        unique, indexes = np.unique(packed, return_inverse=True)
+        rgb = np.stack([unique >> 16, (unique >> 8) & 0xFF, unique & 0xFF], axis=1)
+        if background:
+            palette = [
+                background_style(red, green, blue, dark, style)
+                for (red, green, blue), dark in zip(
+                    rgb.tolist(), contrast_mask(rgb).tolist()
+                )
+            ]
+        else:
+            palette = [
+                color_style(red, green, blue, style)
+                for red, green, blue in rgb.tolist()
+            ]
+        return cls(starts, ends, indexes.reshape(-1), palette)
+
+    @classmethod
+    def empty(cls) -> "CompactSpans":
+        """Get an empty set of spans."""
+        empty = np.zeros(0, dtype=np.uint32)
+        return cls(empty, empty, empty, ())
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    @property
+    def nbytes(self) -> int:
+        """The size of the offset and index arrays, in bytes."""
+        return self.starts.nbytes + self.ends.nbytes + self.indexes.nbytes
+
+    def to_spans(self, palette: Optional[Sequence[Style]] = None) -> List[Span]:
+        """Build the `Span`s.
+
+        Args:
+            palette (Sequence[Style], optional): Styles to use in place of \
+the palette, index for index. Defaults to None, which uses the palette.
+
+        Returns:
+            List[Span]: One span per stored span, in order.
+        """
+        if palette is None:
+            palette = self.palette
+        return [
+            Span(start, end, palette[index])
+            for start, end, index in zip(
+                self.starts.tolist(), self.ends.tolist(), self.indexes.tolist()
+            )
+        ]
+
+    def quantize(self, color_system: ColorSystem) -> "CompactSpans":
+        """Downgrade the palette to a color system and merge the runs.
+
+        Only the palette is downgraded; spans that touch and end up with the \
+same palette entry are merged on the index array. The result is kept per \
+color system, so a gradient rendered many times is quantized once.
+
+        Args:
+            color_system (ColorSystem): The target color system.
+
+        Returns:
+            CompactSpans: The quantized spans.
+        """
+        quantized = self._quantized.get(color_system)
+        if quantized is not None:
+            return quantized
+        positions: Dict[Style, int] = {}
+        palette: List[Style] = []
+        remap = np.empty(len(self.palette), dtype=np.uint32)
+        for index, style in enumerate(downgrade_styles(self.palette, color_system)):
+            position = positions.get(style)
+            if position is None:
+                position = positions[style] = len(palette)
+                palette.append(style)
+            remap[index] = position
+        indexes = remap[self.indexes]
+        starts, ends = self.starts, self.ends
+        if len(indexes):
+            first = np.ones(len(indexes), dtype=bool)
+            first[1:] = (indexes[1:] != indexes[:-1]) | (starts[1:] != ends[:-1])
+            (heads,) = np.nonzero(first)
+            ends = ends[np.append(heads[1:] - 1, len(indexes) - 1)]
+            starts, indexes = starts[heads], indexes[heads]
+        quantized = self._quantized[color_system] = CompactSpans(
+            starts, ends, indexes, palette
+        )
+        return quantized
+
+    def concatenate(self, other: "CompactSpans") -> "CompactSpans":
+        """Append the spans of another set, merging the two palettes.
+
+        Args:
+            other (CompactSpans): The spans to append.
+
+        Returns:
+            CompactSpans: A new set with the spans of both.
+        """
+        positions: Dict[Style, int] = {
+            style: index for index, style in enumerate(self.palette)
+        }
+        palette = list(self.palette)
+        remap = np.empty(len(other.palette), dtype=np.uint32)
+        for index, style in enumerate(other.palette):
+            position = positions.get(style)
+            if position is None:
+                position = positions[style] = len(palette)
+                palette.append(style)
+            remap[index] = position
+        return CompactSpans(
+            np.concatenate([self.starts, other.starts]),
+            np.concatenate([self.ends, other.ends]),
+            np.concatenate([self.indexes, remap[other.indexes]]),
+            palette,
+        )
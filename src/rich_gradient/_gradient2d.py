@@ -0,0 +1,170 @@
+"""Color a block of text with a two dimensional gradient."""
+
+from __future__ import annotations
+
+import math
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from pydantic_extra_types.color import ColorType
+from rich.console import Console, ConsoleOptions, RenderResult
+from rich.control import strip_control_codes
+from rich.measure import Measurement
+from rich.segment import Segment
+from rich.style import Style, StyleType
+from rich.text import Text
+
+from rich_gradient._cells import cell_columns
+from rich_gradient._ramp import (
+    Interpolation,
+    cached_ramp,
+    gradient_stops,
+    quantize_spans,
+    quantized_color_system,
+    ramp_spans,
+    ramp_stops,
+)
+from rich_gradient.color import Color
+
+GRID_CACHE_SIZE: int = 8
+# Terminal cells are about twice as tall as they are wide.
+CELL_ASPECT: float = 2.0
+# The number of colors sampled along the direction of an angled gradient.
+RAMP_RESOLUTION: int = 1024
+
+
+class Gradient2D:
+    """A gradient across both the rows and the columns of a block of text.
+
+    Either the colors run along a direction given by `angle`, or the block \
+blends between four `corners`. The colors of every cell are computed in a \
+single NumPy operation, cached per rendered size, and each row is emitted \
+as merged spans.
+
+    Args:
+        text (str): The block of text, e.g. ASCII art.
+        colors (Sequence[ColorType], optional): The colors along the \
+gradient's direction. Defaults to None, which uses the first colors of the \
+spectrum.
+        angle (float): The direction of the gradient in degrees, clockwise \
+from left to right: 0 runs left to right, 90 top to bottom. Defaults to 0.
+        corners (Sequence[ColorType], optional): The top left, top right, \
+bottom left and bottom right colors. If given, the block blends bilinearly \
+between them and `colors` and `angle` are ignored. Defaults to None.
+        style (StyleType): A style applied beneath the gradient. Defaults to \
+`Style.null()`.
+        interpolation (Interpolation): The color space the colors along an \
+angled gradient blend in. Defaults to "rgb".
+    """
+
+    def __init__(
+        self,
+        text: str,
+        colors: Optional[Sequence[ColorType]] = None,
+        *,
+        angle: float = 0.0,
+        corners: Optional[Sequence[ColorType]] = None,
+        style: StyleType = Style.null(),
+        interpolation: Interpolation = "rgb",
+    ) -> None:
+        self.lines: List[str] = strip_control_codes(text).splitlines()
+        if corners is not None:
+            if len(corners) != 4:
+                raise ValueError("A 2D gradient needs exactly four corner colors.")
+            self.corners: Optional[Tuple[Tuple[int, int, int], ...]] = ramp_stops(
+                [Color(color) for color in corners]
+            )
+            self.colors: List[Color] = []
+        else:
+            self.corners = None
+            self.colors = gradient_stops(colors)
+        self.angle = angle
+        self.style = Style.parse(style) if isinstance(style, str) else style
+        self.interpolation = interpolation
+        self._columns = [cell_columns(line) for line in self.lines]
+        self.width = max((width for _, width in self._columns), default=0)
+        self._grid_cache: Dict[Tuple[int, int], np.ndarray] = {}
+
+    def color_grid(self, rows: int, columns: int) -> np.ndarray:
+        """Get the color of every cell of a block of the given size.
+
+        Args:
+            rows (int): The number of rows.
+            columns (int): The number of columns.
+
+        Returns:
+            np.ndarray: A read-only `(rows, columns, 3)` array of `uint8` RGB \
+values.
+        """
+        key = (rows, columns)
+        grid = self._grid_cache.get(key)
+        if grid is not None:
+            return grid
+        # The position of each cell's center, from 0 to 1 across the block.
+        x = (np.arange(columns) + 0.5) / max(columns, 1)
+        y = (np.arange(rows) + 0.5) / max(rows, 1)
+        if self.corners is not None:
+            top_left, top_right, bottom_left, bottom_right = np.array(
+                self.corners, dtype=np.float64
+            )
+            u = x[np.newaxis, :, np.newaxis]
+            v = y[:, np.newaxis, np.newaxis]
+            top = top_left + (top_right - top_left) * u
+            bottom = bottom_left + (bottom_right - bottom_left) * u
+            grid = (top + (bottom - top) * v).astype(np.uint8)
+        else:
+            radians = math.radians(self.angle)
+            dx = math.cos(radians) * columns
+            dy = math.sin(radians) * rows * CELL_ASPECT
+            projection = x[np.newaxis, :] * dx + y[:, np.newaxis] * dy
+            low = min(0.0, dx) + min(0.0, dy)
+            high = max(0.0, dx) + max(0.0, dy)
+            blend = (projection - low) / ((high - low) or 1.0)
+            ramp = cached_ramp(
+                ramp_stops(self.colors), RAMP_RESOLUTION, self.interpolation
+            )
+            grid = ramp[np.rint(blend * (RAMP_RESOLUTION - 1)).astype(np.int64)]
+        grid.flags.writeable = False
+        if len(self._grid_cache) >= GRID_CACHE_SIZE:
+            del self._grid_cache[next(iter(self._grid_cache))]
+        self._grid_cache[key] = grid
+        return grid
+
+    def render_lines(self, width: Optional[int] = None) -> List[Text]:
+        """Color the block's lines, cropped to a width.
+
+        Args:
+            width (int, optional): The number of columns to render. Defaults \
+to None, which renders the whole block.
+
+        Returns:
+            List[Text]: One colored `Text` per row.
+        """
+        columns = self.width if width is None else min(width, self.width)
+        grid = self.color_grid(len(self.lines), columns)
+        lines: List[Text] = []
+        for row, (line, (line_columns, _)) in enumerate(zip(self.lines, self._columns)):
+            visible = int(np.searchsorted(line_columns, columns))
+            ramp = grid[row, line_columns[:visible]]
+            text = Text(line[:visible], end="")
+            text.spans = ramp_spans(ramp, self.style, merge=True)
+            # A wide character may straddle the last column.
+            text.truncate(columns)
+            lines.append(text)
+        return lines
+
+    def __rich_console__(
+        self, console: Console, options: ConsoleOptions
+    ) -> RenderResult:
+        lines = self.render_lines(options.max_width)
+        color_system = quantized_color_system(console)
+        for line in lines:
+            if color_system is not None:
+                line.spans = quantize_spans(line.spans, color_system)
+            yield from line.render(console)
+            yield Segment.line()
+
+    def __rich_measure__(
+        self, console: Console, options: ConsoleOptions
+    ) -> Measurement:
+        return Measurement(self.width, self.width)
@@ -0,0 +1,194 @@
+"""Defer the computation of a gradient's spans until they are first needed."""
+
+from __future__ import annotations
+
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from rich.style import Style
+from rich.text import Span, Text
+
+from rich_gradient._compact import CompactSpans
+
+# The slot descriptor backing `Text._spans`.
+_TEXT_SPANS = Text.__dict__["_spans"]
+
+
+def raw_spans(text: Text) -> List[Span]:
+    """Get the spans stored on a text without generating a pending gradient.
+
+    Args:
+        text (Text): The gradient text.
+
+    Returns:
+        List[Span]: The stored spans.
+    """
+    return _TEXT_SPANS.__get__(text, type(text))
+
+
+def compact_spans(text: Text) -> Optional[CompactSpans]:
+    """Get the compact gradient spans of a text, if it holds any.
+
+    Args:
+        text (Text): The gradient text.
+
+    Returns:
+        Optional[CompactSpans]: The gradient's spans, or None if they are \
+stored as `Span`s or not generated yet.
+    """
+    return getattr(text, "_compact_spans", None)
+
+
+def materialize_spans(text: Text) -> List[Span]:
+    """Generate a gradient's spans and store them on the text.
+
+    The generated spans are placed before any spans already stored on the \
+text. Spans held in compact form are built from their arrays instead of \
+being generated again.
+
+    Args:
+        text (Text): A gradient with a `generate_spans()` method.
+
+    Returns:
+        List[Span]: The stored spans.
+    """
+    compact = compact_spans(text)
+    if compact is not None:
+        palette = tuple(style.copy() for style in compact.palette)
+        return store_spans(text, compact.to_spans(palette), palette)
+    return store_spans(text, list(text.generate_spans()))  # type: ignore
+
+
+def store_compact(text: Text, compact: CompactSpans) -> None:
+    """Store gradient spans on a text in compact form.
+
+    The `Span`s are only built when the text's `_spans` are first read. \
+Until then the spans stored on the text are the other spans alone.
+
+    Args:
+        text (Text): A gradient with `_compact_spans` and `_gradient_styles` \
+slots.
+        compact (CompactSpans): The gradient's spans.
+    """
+    text._compact_spans = compact  # type: ignore[attr-defined]
+    text._gradient_styles = compact.palette  # type: ignore[attr-defined]
+    text._spans_pending = True  # type: ignore[attr-defined]
+
+
+def store_spans(
+    text: Text,
+    gradient_spans: List[Span],
+    styles: Optional[Sequence[Style]] = None,
+) -> List[Span]:
+    """Store already generated gradient spans on a text.
+
+    The styles of the gradient's spans are recorded in `_gradient_styles`, \
+so `split_spans` can tell the gradient apart from the other spans. The \
+styles must be copies private to the text: the interned styles of a ramp are \
+shared by every gradient with the same colors, including gradients nested \
+in this one's text.
+
+    Args:
+        text (Text): The gradient text.
+        gradient_spans (List[Span]): The gradient's spans.
+        styles (Sequence[Style], optional): The distinct styles of the \
+gradient's spans, already private to the text. Defaults to None, which \
+copies the styles of the spans.
+
+    Returns:
+        List[Span]: The stored spans.
+    """
+    if styles is None:
+        private: Dict[int, Style] = {}
+        for span in gradient_spans:
+            if id(span.style) not in private:
+                private[id(span.style)] = span.style.copy()  # type: ignore
+        gradient_spans = [
+            Span(span.start, span.end, private[id(span.style)])
+            for span in gradient_spans
+        ]
+        styles = list(private.values())
+    spans = gradient_spans + raw_spans(text)
+    _TEXT_SPANS.__set__(text, spans)
+    _clear_compact(text)
+    text._spans_pending = False  # type: ignore[attr-defined]
+    text._gradient_styles = tuple(styles)  # type: ignore[attr-defined]
+    return spans
+
+
+def split_spans(text: Text) -> Tuple[List[Span], List[Span]]:
+    """Split the spans stored on a text into the gradient's and the others.
+
+    Gradient spans are told apart by the identity of their styles, which \
+`store_spans` keeps private to the text, and which survives `Text` methods \
+that rebuild the spans, such as `right_crop()` or `copy.deepcopy()`. Other \
+spans only share a gradient's style object if it was taken from the gradient.
+
+    Args:
+        text (Text): The gradient text.
+
+    Returns:
+        Tuple[List[Span], List[Span]]: The gradient's stored spans, and the \
+other spans. A gradient whose spans are pending has no stored spans.
+    """
+    spans = raw_spans(text)
+    if getattr(text, "_spans_pending", False):
+        return [], list(spans)
+    styles = {id(style) for style in getattr(text, "_gradient_styles", ())}
+    gradient_spans: List[Span] = []
+    other_spans: List[Span] = []
+    for span in spans:
+        if id(span.style) in styles:
+            gradient_spans.append(span)
+        else:
+            other_spans.append(span)
+    return gradient_spans, other_spans
+
+
+def _clear_compact(text: Text) -> None:
+    """Drop the compact spans of a text, once its `Span`s are stored."""
+    if compact_spans(text) is not None:
+        text._compact_spans = None  # type: ignore[attr-defined]
+
+
+class LazySpans:
+    """A descriptor that replaces `Text._spans` on gradient classes.
+
+    While the instance's `_spans_pending` flag is set, the first read of \
+`_spans` generates and stores the gradient's spans. Any code reading \
+`_spans`, including rich's own `Text` methods, therefore sees the gradient. \
+Assigning `_spans` clears the flag, and drops any compact spans. It keeps \
+`_gradient_styles`, which `copy.deepcopy()` may restore before `_spans`.
+    """
+
+    def __get__(self, instance: Optional[Text], owner: Any = None) -> Any:
+        if instance is None:
+            return self
+        if getattr(instance, "_spans_pending", False):
+            return materialize_spans(instance)
+        return _TEXT_SPANS.__get__(instance, owner)
+
+    def __set__(self, instance: Text, spans: List[Span]) -> None:
+        instance._spans_pending = False  # type: ignore[attr-defined]
+        _clear_compact(instance)
+        _TEXT_SPANS.__set__(instance, spans)
+
+
+class DeferredSpans:
+    """A descriptor for `_spans` on short-lived views of a gradient.
+
+    While the instance's `_spans_pending` flag is set, the first read of \
+`_spans` builds them with the instance's `generate_spans()` and keeps them on \
+the instance only, so the gradient it views does not store them.
+    """
+
+    def __get__(self, instance: Optional[Text], owner: Any = None) -> Any:
+        if instance is None:
+            return self
+        if getattr(instance, "_spans_pending", False):
+            instance._spans_pending = False  # type: ignore[attr-defined]
+            _TEXT_SPANS.__set__(instance, instance.generate_spans())  # type: ignore
+        return _TEXT_SPANS.__get__(instance, owner)
+
+    def __set__(self, instance: Text, spans: List[Span]) -> None:
+        instance._spans_pending = False  # type: ignore[attr-defined]
+        _TEXT_SPANS.__set__(instance, spans)
@@ -0,0 +1,57 @@
+"""Measure gradient text once, and skip `cell_len` for plain ASCII."""
+
+from __future__ import annotations
+
+from typing import Optional, Tuple
+
+from rich.cells import cell_len
+from rich.measure import Measurement
+from rich.text import Text
+
+# The plain string a measurement was taken from, and the measurement.
+MeasureCache = Tuple[str, Measurement]
+
+
+def measure_plain(plain: str) -> Measurement:
+    """Measure the minimum and maximum widths of a plain string.
+
+    The widest word gives the minimum width and the widest line the maximum, \
+as in `Text.__rich_measure__`. Printable ASCII is one cell per character, so \
+its widths are taken with `len` instead of `cell_len`.
+
+    Args:
+        plain (str): The string to measure.
+
+    Returns:
+        Measurement: The minimum and maximum widths, in cells.
+    """
+    lines = plain.splitlines()
+    words = plain.split()
+    width = len if plain.isascii() and all(map(str.isprintable, lines)) else cell_len
+    max_text_width = max(map(width, lines)) if lines else 0
+    min_text_width = max(map(width, words)) if words else max_text_width
+    return Measurement(min_text_width, max_text_width)
+
+
+def cached_measure(text: Text) -> Measurement:
+    """Measure a gradient, reusing its last measurement if it is unchanged.
+
+    The measurement is kept in the text's `_measure_cache` slot, with the \
+plain string it was taken from. It is reused as long as the text still holds \
+that very string object as its only part. Every mutating method of `Text` \
+either adds parts or stores a new string, so an identity check suffices.
+
+    Args:
+        text (Text): A gradient with a `_measure_cache` slot.
+
+    Returns:
+        Measurement: The minimum and maximum widths, in cells.
+    """
+    cached: Optional[MeasureCache] = getattr(text, "_measure_cache", None)
+    parts = text._text
+    if cached is not None and len(parts) == 1 and parts[0] is cached[0]:
+        return cached[1]
+    plain = text.plain
+    measurement = measure_plain(plain)
+    text._measure_cache = (plain, measurement)  # type: ignore[attr-defined]
+    return measurement
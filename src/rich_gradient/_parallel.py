@@ -0,0 +1,145 @@
+"""Render large gradient documents across several processes."""
+
+from __future__ import annotations
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+from pydantic_extra_types.color import ColorType
+from rich.console import COLOR_SYSTEMS, Console, ConsoleOptions
+from rich.control import strip_control_codes
+from rich.style import Style, StyleType
+from rich.text import Text
+
+from rich_gradient._ramp import (
+    QUANTIZED_SYSTEMS,
+    RGB,
+    gradient_stops,
+    quantize_spans,
+    ramp_spans,
+    ramp_stops,
+    ramp_window,
+)
+
+CHUNKS_PER_WORKER: int = 4
+
+
+class _Chunk(NamedTuple):
+    """The picklable description of a run of lines rendered by a worker."""
+
+    text: str
+    offset: int
+    length: int
+    stops: Tuple[RGB, ...]
+    style: str
+    width: int
+    color_system: Optional[str]
+    options: Tuple[Optional[str], Optional[str], Optional[bool], int]
+
+
+def render_parallel(
+    text: str,
+    colors: Optional[Sequence[ColorType]] = None,
+    options: Optional[ConsoleOptions] = None,
+    *,
+    workers: Optional[int] = None,
+    console: Optional[Console] = None,
+    style: StyleType = Style.null(),
+) -> str:
+    """Render a large text with a gradient to ANSI, using several processes.
+
+    The text is split on line boundaries into chunks. Each chunk is colored \
+with its own window of the gradient of the whole text, so the colors run on \
+continuously across chunks, then rendered in a worker process. The rendered \
+chunks are joined back in order.
+
+    Args:
+        text (str): The text to render.
+        colors (Sequence[ColorType], optional): The colors of the gradient. \
+Defaults to None, which uses the first colors of the spectrum.
+        options (ConsoleOptions, optional): The options to render with, for \
+the width, justify, overflow and no_wrap settings. Defaults to None, which \
+uses the console's options.
+        workers (int, optional): The number of processes. Defaults to None, \
+which uses one per CPU. With a single worker the text is rendered in this \
+process.
+        console (Console, optional): The console whose color system and tab \
+size are used. Defaults to None, which uses a new `Console`.
+        style (StyleType): A style applied beneath the gradient. Defaults to \
+`Style.null()`.
+
+    Returns:
+        str: The rendered text, with ANSI escape codes.
+    """
+    console = console or Console()
+    options = options or console.options
+    color_stops = gradient_stops(colors)
+    workers = max(workers or os.cpu_count() or 1, 1)
+
+    text = strip_control_codes(text).expandtabs(console.tab_size)
+    lines = text.split("\n")
+    size = max(-(-len(lines) // (workers * CHUNKS_PER_WORKER)), 1)
+    stops = ramp_stops(color_stops)
+    render_options = (
+        options.justify,
+        options.overflow,
+        options.no_wrap,
+        console.tab_size,
+    )
+
+    chunks: List[_Chunk] = []
+    offset = 0
+    for start in range(0, len(lines), size):
+        chunk = "\n".join(lines[start : start + size])
+        chunks.append(
+            _Chunk(
+                chunk,
+                offset,
+                len(text),
+                stops,
+                str(style),
+                options.max_width,
+                console.color_system,
+                render_options,
+            )
+        )
+        # Account for the newline that joins this chunk to the next.
+        offset += len(chunk) + 1
+
+    if workers == 1 or len(chunks) == 1:
+        return "".join(map(_render_chunk, chunks))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return "".join(executor.map(_render_chunk, chunks))
+
+
+def _render_chunk(chunk: _Chunk) -> str:
+    """Render a chunk of lines to ANSI, in a worker process."""
+    justify, overflow, no_wrap, tab_size = chunk.options
+    console = Console(
+        width=chunk.width,
+        color_system=chunk.color_system,  # type: ignore[arg-type]
+        force_terminal=chunk.color_system is not None,
+        legacy_windows=False,
+        tab_size=tab_size,
+    )
+    style = Style.parse(chunk.style)
+    ramp = ramp_window(
+        np.array(chunk.stops, dtype=np.int64),
+        chunk.length,
+        chunk.offset,
+        chunk.offset + len(chunk.text),
+    )
+    spans = ramp_spans(ramp, style, merge=True)
+    color_system = COLOR_SYSTEMS.get(chunk.color_system or "")
+    if color_system in QUANTIZED_SYSTEMS:
+        spans = quantize_spans(spans, color_system)  # type: ignore[arg-type]
+    with console.capture() as capture:
+        console.print(
+            Text(chunk.text, spans=spans),
+            justify=justify,
+            overflow=overflow,
+            no_wrap=no_wrap,
+        )
+    return capture.get()
@@ -0,0 +1,70 @@
+"""Quantize the gradients that `Console.print` joins into a single text."""
+
+from __future__ import annotations
+
+from copy import copy
+from typing import List
+
+from rich.align import Align
+from rich.color import ColorSystem
+from rich.console import Console, ConsoleRenderable, RenderHook
+from rich.styled import Styled
+from rich.text import Text
+
+from rich_gradient._ramp import quantize_spans, quantized_color_system
+
+
+class QuantizeHook(RenderHook):
+    """A render hook that quantizes the spans of printed texts.
+
+    `Console.print` joins its `Text` arguments, gradients included, into a \
+single `Text` before any of them sees the console, so a gradient can not \
+quantize itself there. The hook downgrades the joined spans to the console's \
+color system and merges the runs that land on the same palette entry, which \
+keeps 256 and 16 color output to one escape sequence per run.
+
+    Args:
+        console (Console): The console the hook is installed on.
+    """
+
+    def __init__(self, console: Console) -> None:
+        self.console = console
+
+    def process_renderables(
+        self, renderables: List[ConsoleRenderable]
+    ) -> List[ConsoleRenderable]:
+        color_system = quantized_color_system(self.console)
+        if color_system is None:
+            return renderables
+        return [self._quantize(renderable, color_system) for renderable in renderables]
+
+    def _quantize(
+        self, renderable: ConsoleRenderable, color_system: ColorSystem
+    ) -> ConsoleRenderable:
+        """Quantize a text, or the text inside `print`'s justify or style wrapper."""
+        if isinstance(renderable, (Align, Styled)) and isinstance(
+            renderable.renderable, Text
+        ):
+            wrapper = copy(renderable)
+            wrapper.renderable = self._quantize(renderable.renderable, color_system)
+            return wrapper
+        if not isinstance(renderable, Text) or not renderable.spans:
+            return renderable
+        text = renderable.copy()
+        text.spans = quantize_spans(renderable.spans, color_system)
+        return text
+
+
+def install_quantizer(console: Console) -> QuantizeHook:
+    """Quantize the gradients printed on a console to its color system.
+
+    Args:
+        console (Console): The console to install the hook on.
+
+    Returns:
+        QuantizeHook: The installed hook, which `console.pop_render_hook` \
+removes again.
+    """
+    hook = QuantizeHook(console)
+    console.push_render_hook(hook)
+    return hook
@@ -0,0 +1,696 @@
+"""Compute the per-character colors of a gradient in a single NumPy pass."""
+
+# ruff: noqa: F401
+from __future__ import annotations
+
+from itertools import repeat
+from typing import Dict, Iterable, List, Literal, Optional, Sequence, Tuple
+
+import numpy as np
+from pydantic_extra_types.color import ColorType
+from rich.color import Color as RichColor
+from rich.color import ColorSystem
+from rich.console import COLOR_SYSTEMS, Console
+from rich.style import Style
+from rich.text import Span
+
+from rich_gradient._cache import LRUCache
+from rich_gradient.color import Color
+from rich_gradient.spectrum import SPECTRUM
+
+RGB = Tuple[int, int, int]
+Interpolation = Literal["rgb", "oklab", "lch"]
+INTERPOLATIONS: Tuple[str, ...] = ("rgb", "oklab", "lch")
+
+QUANTIZED_SYSTEMS: Tuple[ColorSystem, ...] = (
+    ColorSystem.STANDARD,
+    ColorSystem.EIGHT_BIT,
+    ColorSystem.WINDOWS,
+)
+
+STYLE_CACHE_SIZE: int = 4096
+STYLE_CACHE: LRUCache[Style] = LRUCache(maxsize=STYLE_CACHE_SIZE)
+# Downgraded styles, keyed on the style and the color system.
+DOWNGRADE_CACHE: LRUCache[Style] = LRUCache(maxsize=STYLE_CACHE_SIZE)
+
+RAMP_CACHE_SIZE: int = 256
+RAMP_CACHE_MAX_LENGTH: int = 65536
+RAMP_CACHE: LRUCache[np.ndarray] = LRUCache(maxsize=RAMP_CACHE_SIZE)
+
+HUE_WHEEL_SIZE: int = 3600
+RAINBOW_PHASE: float = 300.0
+RAINBOW_SPAN: float = -330.0
+# The number of spectrum colors used when a gradient is given none.
+DEFAULT_HUES: int = 4
+
+# The foregrounds of text on a gradient background, as `Color.get_contrast`
+# picks them.
+CONTRAST_DARK: RichColor = RichColor.from_rgb(0, 0, 0)
+CONTRAST_LIGHT: RichColor = RichColor.from_rgb(255, 255, 255)
+
+LUT_SIZE: int = 1024
+LUT_CACHE_SIZE: int = 512
+LUT_CACHE: LRUCache[np.ndarray] = LRUCache(maxsize=LUT_CACHE_SIZE)
+
+# The matrices of Björn Ottosson's OKLab, from linear sRGB.
+_LMS_FROM_RGB = np.array(
+    [
+        [0.4122214708, 0.5363325363, 0.0514459929],
+        [0.2119034982, 0.6806995451, 0.1073969566],
+        [0.0883024619, 0.2817188376, 0.6299787005],
+    ]
+)
+_OKLAB_FROM_LMS = np.array(
+    [
+        [0.2104542553, 0.7936177850, -0.0040720468],
+        [1.9779984951, -2.4285922050, 0.4505937099],
+        [0.0259040371, 0.7827717662, -0.8086757660],
+    ]
+)
+_LMS_FROM_OKLAB = np.linalg.inv(_OKLAB_FROM_LMS)
+_RGB_FROM_LMS = np.linalg.inv(_LMS_FROM_RGB)
+
+
+def gradient_stops(colors: Optional[Sequence[ColorType]] = None) -> List[Color]:
+    """Validate the colors of a gradient.
+
+    Args:
+        colors (Sequence[ColorType], optional): The colors of the gradient. \
+Defaults to None, which uses the first `DEFAULT_HUES` colors of the spectrum.
+
+    Returns:
+        List[Color]: The colors.
+
+    Raises:
+        ValueError: If fewer than two colors are given.
+    """
+    if colors:
+        stops = [Color(color) for color in colors]
+    else:
+        stops = list(SPECTRUM.window(0, DEFAULT_HUES))
+    if len(stops) < 2:
+        raise ValueError("Gradient must have at least two colors.")
+    return stops
+
+
+def ramp_stops(colors: Sequence[Color]) -> Tuple[RGB, ...]:
+    """Get the gradient's color stops as a hashable tuple of RGB values.
+
+    Args:
+        colors (Sequence[Color]): The color stops of the gradient.
+
+    Returns:
+        Tuple[RGB, ...]: One `(red, green, blue)` tuple per color stop.
+    """
+    return tuple(tuple(color.triplet) for color in colors)  # type: ignore[misc]
+
+
+def generate_ramp(
+    stops: np.ndarray, length: int, interpolation: Interpolation = "rgb"
+) -> np.ndarray:
+    """Interpolate `length` colors across the color stops.
+
+    The characters are split into `len(stops) - 1` near-equal segments, the \
+same way `numpy.array_split` would split them, and each segment blends \
+linearly from one stop towards the next.
+
+    Args:
+        stops (np.ndarray): An `(n, 3)` array of RGB color stops, `n >= 2`.
+        length (int): The number of characters to color.
+        interpolation (Interpolation): The color space to interpolate in. \
+Defaults to "rgb".
+
+    Returns:
+        np.ndarray: A `(length, 3)` array of `uint8` RGB values.
+    """
+    return ramp_window(stops, length, 0, length, interpolation)
+
+
+def ramp_window(
+    stops: np.ndarray,
+    length: int,
+    start: int,
+    stop: int,
+    interpolation: Interpolation = "rgb",
+) -> np.ndarray:
+    """Interpolate the colors of positions `start` to `stop` of a ramp.
+
+    The result equals `generate_ramp(stops, length)[start:stop]`, but only \
+the requested window is computed, so slices of very long ramps stay cheap.
+
+    Args:
+        stops (np.ndarray): An `(n, 3)` array of RGB color stops, `n >= 2`.
+        length (int): The length of the whole ramp.
+        start (int): The first position to compute.
+        stop (int): The position after the last one to compute.
+        interpolation (Interpolation): The color space to interpolate in. \
+Defaults to "rgb".
+
+    Returns:
+        np.ndarray: A `(stop - start, 3)` array of `uint8` RGB values.
+    """
+    segments = len(stops) - 1
+    if segments < 1:
+        raise ValueError("Gradient must have at least two colors.")
+    start, stop = max(start, 0), min(stop, length)
+    if stop <= start:
+        return np.empty((0, 3), dtype=np.uint8)
+    return _interpolate(stops, np.arange(start, stop), length, interpolation)
+
+
+def batch_ramps(
+    stops: np.ndarray,
+    lengths: Sequence[int],
+    interpolation: Interpolation = "rgb",
+) -> List[np.ndarray]:
+    """Interpolate the ramps of several lengths in a single vectorized pass.
+
+    Each ramp equals `generate_ramp(stops, length)`. Repeated lengths are \
+computed once and share the same array.
+
+    Args:
+        stops (np.ndarray): An `(n, 3)` array of RGB color stops, `n >= 2`.
+        lengths (Sequence[int]): The length of each ramp.
+        interpolation (Interpolation): The color space to interpolate in. \
+Defaults to "rgb".
+
+    Returns:
+        List[np.ndarray]: One `(length, 3)` array of `uint8` RGB values per \
+length.
+    """
+    if len(stops) < 2:
+        raise ValueError("Gradient must have at least two colors.")
+    unique, inverse = np.unique(
+        np.asarray(lengths, dtype=np.int64), return_inverse=True
+    )
+    unique = np.maximum(unique, 0)
+    ends = np.cumsum(unique)
+    starts = ends - unique
+    total = int(ends[-1]) if len(ends) else 0
+    # The position of every character within its own ramp, and that ramp's length.
+    positions = np.arange(total) - np.repeat(starts, unique)
+    ramps = np.split(
+        _interpolate(stops, positions, np.repeat(unique, unique), interpolation),
+        ends[:-1],
+    )
+    return [ramps[index] for index in inverse.tolist()]
+
+
+def _interpolate(
+    stops: np.ndarray,
+    positions: np.ndarray,
+    length: "int | np.ndarray",
+    interpolation: Interpolation = "rgb",
+) -> np.ndarray:
+    """Interpolate the colors at `positions` of ramps of the given length(s)."""
+    segments = len(stops) - 1
+    # The first `extra` segments hold one more character than the others.
+    base, extra = np.divmod(length, segments)
+    long_length = extra * (base + 1)
+    is_long = positions < long_length
+    short_positions = positions - long_length
+    short_size = np.maximum(base, 1)
+
+    segment = np.where(
+        is_long, positions // (base + 1), extra + short_positions // short_size
+    )
+    offset = np.where(is_long, positions % (base + 1), short_positions % short_size)
+    blend = offset / np.where(is_long, base + 1, base)
+    if interpolation != "rgb":
+        luts = np.stack(
+            [
+                pair_lut(tuple(first), tuple(last), interpolation)  # type: ignore
+                for first, last in zip(stops[:-1].tolist(), stops[1:].tolist())
+            ]
+        )
+        return luts[segment, np.rint(blend * (LUT_SIZE - 1)).astype(np.int64)]
+    first = stops[segment]
+    delta = stops[segment + 1] - first
+    return (first + delta * blend[:, np.newaxis]).astype(np.uint8)
+
+
+def pair_lut(start: RGB, end: RGB, interpolation: Interpolation) -> np.ndarray:
+    """Get the lookup table of a perceptual blend between two colors.
+
+    The blend is sampled `LUT_SIZE` times, converted back to sRGB once, and \
+kept in the process-wide `LUT_CACHE`, so a perceptual ramp is reduced to \
+indexing into the tables of its stop pairs.
+
+    Args:
+        start (RGB): The first color.
+        end (RGB): The last color.
+        interpolation (Interpolation): Either "oklab" or "lch", the \
+cylindrical form of OKLab, which blends hues along the shorter arc.
+
+    Returns:
+        np.ndarray: A read-only `(LUT_SIZE, 3)` array of `uint8` RGB values.
+    """
+    key = (start, end, interpolation)
+    lut = LUT_CACHE.get(key)
+    if lut is None:
+        lab = rgb_to_oklab(np.array([start, end]))
+        blend = np.linspace(0.0, 1.0, LUT_SIZE)[:, np.newaxis]
+        if interpolation == "lch":
+            lch = oklab_to_lch(lab)
+            hue_delta = (lch[1, 2] - lch[0, 2] + np.pi) % (2 * np.pi) - np.pi
+            delta = np.array([lch[1, 0] - lch[0, 0], lch[1, 1] - lch[0, 1], hue_delta])
+            samples = lch_to_oklab(lch[0] + delta * blend)
+        elif interpolation == "oklab":
+            samples = lab[0] + (lab[1] - lab[0]) * blend
+        else:
+            raise ValueError(f"Unknown interpolation: {interpolation!r}")
+        lut = oklab_to_rgb(samples)
+        lut.flags.writeable = False
+        LUT_CACHE.set(key, lut)
+    return lut
+
+
+def rgb_to_oklab(rgb: np.ndarray) -> np.ndarray:
+    """Convert `(n, 3)` sRGB values in 0-255 to OKLab."""
+    srgb = np.asarray(rgb, dtype=np.float64) / 255
+    linear = np.where(srgb <= 0.04045, srgb / 12.92, ((srgb + 0.055) / 1.055) ** 2.4)
+    return np.cbrt(linear @ _LMS_FROM_RGB.T) @ _OKLAB_FROM_LMS.T
+
+
+def oklab_to_rgb(lab: np.ndarray) -> np.ndarray:
+    """Convert `(n, 3)` OKLab values to `uint8` sRGB, clipping to the gamut."""
+    linear = np.clip(((lab @ _LMS_FROM_OKLAB.T) ** 3) @ _RGB_FROM_LMS.T, 0.0, 1.0)
+    srgb = np.where(
+        linear <= 0.0031308, linear * 12.92, 1.055 * linear ** (1 / 2.4) - 0.055
+    )
+    return np.rint(srgb * 255).astype(np.uint8)
+
+
+def oklab_to_lch(lab: np.ndarray) -> np.ndarray:
+    """Convert `(n, 3)` OKLab values to lightness, chroma and hue in radians."""
+    return np.stack(
+        [lab[:, 0], np.hypot(lab[:, 1], lab[:, 2]), np.arctan2(lab[:, 2], lab[:, 1])],
+        axis=1,
+    )
+
+
+def lch_to_oklab(lch: np.ndarray) -> np.ndarray:
+    """Convert `(n, 3)` lightness, chroma and hue values to OKLab."""
+    return np.stack(
+        [lch[:, 0], lch[:, 1] * np.cos(lch[:, 2]), lch[:, 1] * np.sin(lch[:, 2])],
+        axis=1,
+    )
+
+
+def hue_wheel(size: int = HUE_WHEEL_SIZE) -> np.ndarray:
+    """Sample the fully saturated, full value HSV hue wheel.
+
+    Args:
+        size (int): The number of hues, evenly spaced from 0 degrees (red). \
+Defaults to `HUE_WHEEL_SIZE`, a tenth of a degree apart.
+
+    Returns:
+        np.ndarray: A read-only `(size, 3)` array of `uint8` RGB values.
+    """
+    hue = np.arange(size) * 6 / size
+    sector = hue.astype(np.int64)
+    rising = hue - sector
+    falling = 1 - rising
+    one, zero = np.ones(size), np.zeros(size)
+    channels = np.array(
+        [
+            [one, rising, zero],
+            [falling, one, zero],
+            [zero, one, rising],
+            [zero, falling, one],
+            [rising, zero, one],
+            [one, zero, falling],
+        ]
+    )
+    wheel = np.rint(channels[sector, :, np.arange(size)] * 255).astype(np.uint8)
+    wheel.flags.writeable = False
+    return wheel
+
+
+HUE_WHEEL: np.ndarray = hue_wheel()
+
+
+def rainbow_window(
+    length: int,
+    start: int,
+    stop: int,
+    phase: float = RAINBOW_PHASE,
+    span: float = RAINBOW_SPAN,
+) -> np.ndarray:
+    """Get the colors of positions `start` to `stop` of a rainbow ramp.
+
+    The ramp walks the precomputed `HUE_WHEEL` from `phase` degrees, its \
+first character, to `phase + span` degrees, its last one, so no color is \
+parsed or converted.
+
+    Args:
+        length (int): The length of the whole ramp.
+        start (int): The first position to compute.
+        stop (int): The position after the last one to compute.
+        phase (float): The hue of the first character, in degrees. Defaults \
+to 300, magenta.
+        span (float): The number of degrees the hue turns across the ramp; \
+negative values turn backwards. Defaults to -330, which runs from magenta \
+through blue, green, yellow and red to pink, like the `Spectrum`.
+
+    Returns:
+        np.ndarray: A read-only `(stop - start, 3)` array of `uint8` RGB \
+values.
+    """
+    start, stop = max(start, 0), min(stop, length)
+    if stop <= start:
+        window = np.empty((0, 3), dtype=np.uint8)
+    else:
+        degrees = phase + span * np.arange(start, stop) / max(length - 1, 1)
+        indexes = np.rint(degrees * HUE_WHEEL_SIZE / 360).astype(np.int64)
+        # Indexing the wheel copies it, so the copy is made read-only too.
+        window = HUE_WHEEL[indexes % HUE_WHEEL_SIZE]
+    window.flags.writeable = False
+    return window
+
+
+def rainbow_ramp(
+    length: int, phase: float = RAINBOW_PHASE, span: float = RAINBOW_SPAN
+) -> np.ndarray:
+    """Get the colors of a rainbow ramp of `length` characters.
+
+    Args:
+        length (int): The number of characters to color.
+        phase (float): The hue of the first character, in degrees. Defaults \
+to 300, magenta.
+        span (float): The number of degrees the hue turns across the ramp. \
+Defaults to -330.
+
+    Returns:
+        np.ndarray: A read-only `(length, 3)` array of `uint8` RGB values.
+    """
+    return rainbow_window(length, 0, length, phase, span)
+
+
+def cached_ramp(
+    stops: Tuple[RGB, ...], length: int, interpolation: Interpolation = "rgb"
+) -> np.ndarray:
+    """Get a color ramp from the `RAMP_CACHE`, computing it on a miss.
+
+    Ramps longer than `RAMP_CACHE_MAX_LENGTH` are computed but not cached.
+
+    Args:
+        stops (Tuple[RGB, ...]): The color stops, as returned by `ramp_stops`.
+        length (int): The number of characters to color.
+        interpolation (Interpolation): The color space to interpolate in. \
+Defaults to "rgb".
+
+    Returns:
+        np.ndarray: A read-only `(length, 3)` array of `uint8` RGB values.
+    """
+    if interpolation not in INTERPOLATIONS:
+        raise ValueError(f"Unknown interpolation: {interpolation!r}")
+    key = (stops, length, interpolation)
+    ramp = RAMP_CACHE.get(key)
+    if ramp is None:
+        ramp = generate_ramp(np.array(stops, dtype=np.int64), length, interpolation)
+        ramp.flags.writeable = False
+        if length <= RAMP_CACHE_MAX_LENGTH:
+            RAMP_CACHE.set(key, ramp)
+    return ramp
+
+
+def configure_ramp_cache(
+    maxsize: Optional[int] = None, max_length: Optional[int] = None
+) -> None:
+    """Configure the size and admission of the `RAMP_CACHE`.
+
+    Args:
+        maxsize (int, optional): The number of ramps to keep before the \
+least recently used ones are evicted.
+        max_length (int, optional): The longest ramp that is cached.
+    """
+    global RAMP_CACHE_MAX_LENGTH
+    if maxsize is not None:
+        RAMP_CACHE.resize(maxsize)
+    if max_length is not None:
+        RAMP_CACHE_MAX_LENGTH = max_length
+
+
+def warm_ramp_cache(
+    colors: Sequence[ColorType],
+    lengths: Iterable[int],
+    interpolation: Interpolation = "rgb",
+) -> None:
+    """Pre-compute the ramps of common lengths, e.g. at startup.
+
+    Args:
+        colors (Sequence[ColorType]): The color stops of the gradient.
+        lengths (Iterable[int]): The text lengths to pre-compute.
+        interpolation (Interpolation): The color space to interpolate in. \
+Defaults to "rgb".
+    """
+    stops = ramp_stops([Color(color) for color in colors])
+    for length in lengths:
+        cached_ramp(stops, length, interpolation)
+
+
+def color_style(red: int, green: int, blue: int, style: Style) -> Style:
+    """Get the interned style of a gradient color on top of a base style.
+
+    Styles are shared through the process-wide `STYLE_CACHE`, so equal \
+colors return the same `Style` object across all gradients.
+
+    Args:
+        red (int): The red component.
+        green (int): The green component.
+        blue (int): The blue component.
+        style (Style): The base style combined with the color.
+
+    Returns:
+        Style: The combined style.
+    """
+    key = (red, green, blue, style)
+    cached = STYLE_CACHE.get(key)
+    if cached is None:
+        cached = STYLE_CACHE.set(
+            key, Style(color=RichColor.from_rgb(red, green, blue)) + style
+        )
+    return cached
+
+
+def ramp_runs(ramp: np.ndarray) -> np.ndarray:
+    """Find the runs of consecutive characters sharing the same color.
+
+    Args:
+        ramp (np.ndarray): A `(length, 3)` array of RGB values.
+
+    Returns:
+        np.ndarray: The offset at which each run starts, followed by the \
+length of the ramp.
+    """
+    length = len(ramp)
+    if length == 0:
+        return np.zeros(1, dtype=np.int64)
+    changes = np.flatnonzero(np.any(ramp[1:] != ramp[:-1], axis=1)) + 1
+    return np.concatenate(([0], changes, [length]))
+
+
+def contrast_mask(ramp: np.ndarray) -> np.ndarray:
+    """Find the colors of a ramp that need a dark foreground.
+
+    Like `Color.get_contrast`, text is black on colors whose brightest \
+component is above half intensity, and white otherwise. The whole ramp is \
+compared at once.
+
+    Args:
+        ramp (np.ndarray): A `(length, 3)` array of RGB values.
+
+    Returns:
+        np.ndarray: A boolean array, True where the foreground is black.
+    """
+    return ramp.max(axis=1, initial=0) > 127
+
+
+def background_style(
+    red: int, green: int, blue: int, dark: bool, style: Style
+) -> Style:
+    """Get the interned style of a gradient background color.
+
+    Args:
+        red (int): The red component.
+        green (int): The green component.
+        blue (int): The blue component.
+        dark (bool): Whether the foreground is black rather than white, as \
+returned by `contrast_mask`.
+        style (Style): The base style combined with the colors.
+
+    Returns:
+        Style: The combined style.
+    """
+    key = (red, green, blue, dark, style)
+    cached = STYLE_CACHE.get(key)
+    if cached is None:
+        cached = STYLE_CACHE.set(
+            key,
+            Style(
+                color=CONTRAST_DARK if dark else CONTRAST_LIGHT,
+                bgcolor=RichColor.from_rgb(red, green, blue),
+            )
+            + style,
+        )
+    return cached
+
+
+def ramp_spans(
+    ramp: np.ndarray,
+    style: Style,
+    merge: bool = False,
+    offset: int = 0,
+    background: bool = False,
+) -> List[Span]:
+    """Generate the spans of a color ramp.
+
+    Args:
+        ramp (np.ndarray): A `(length, 3)` array of RGB values.
+        style (Style): The base style combined with each color.
+        merge (bool): Whether to merge consecutive characters with the same \
+color into a single span. Defaults to False, which generates one span per \
+character.
+        offset (int): The position of the ramp's first character in the \
+text. Defaults to 0.
+        background (bool): Whether the colors are background colors, with \
+contrasting foregrounds. Defaults to False.
+
+    Returns:
+        List[Span]: The gradient's spans.
+    """
+    if merge:
+        runs = ramp_runs(ramp)
+        run_colors = ramp[runs[:-1]]
+        offsets = (runs + offset).tolist()
+    else:
+        run_colors = ramp
+        offsets = list(range(offset, offset + len(ramp) + 1))
+    colors = run_colors.tolist()
+    darks: Iterable[Optional[bool]] = (
+        contrast_mask(run_colors).tolist() if background else repeat(None)
+    )
+
+    styles: Dict[RGB, Style] = {}
+    spans: List[Span] = []
+    append = spans.append
+    for (red, green, blue), dark, start, end in zip(
+        colors, darks, offsets, offsets[1:]
+    ):
+        key = (red, green, blue)
+        span_style = styles.get(key)
+        if span_style is None:
+            span_style = styles[key] = (
+                color_style(red, green, blue, style)
+                if dark is None
+                else background_style(red, green, blue, dark, style)
+            )
+        append(Span(start, end, span_style))
+    return spans
+
+
+def quantized_color_system(console: Console) -> Optional[ColorSystem]:
+    """Get the console's color system if gradients must be quantized for it.
+
+    Args:
+        console (Console): The console being rendered to.
+
+    Returns:
+        Optional[ColorSystem]: The console's color system, or None if the \
+console supports truecolor or no color at all.
+    """
+    color_system = COLOR_SYSTEMS.get(console.color_system or "")
+    return color_system if color_system in QUANTIZED_SYSTEMS else None
+
+
+def downgrade_color(color: RichColor, color_system: ColorSystem) -> RichColor:
+    """Downgrade a color to a palette entry of the color system.
+
+    Unlike `rich.color.Color.downgrade`, the downgraded color is named after \
+its palette entry, so colors that land on the same entry compare equal.
+
+    Args:
+        color (RichColor): The color to downgrade.
+        color_system (ColorSystem): The target color system.
+
+    Returns:
+        RichColor: The downgraded color.
+    """
+    downgraded = color.downgrade(color_system)
+    if downgraded is color or downgraded.number is None:
+        return downgraded
+    return RichColor(
+        f"color({downgraded.number})", downgraded.type, number=downgraded.number
+    )
+
+
+def downgrade_style(style: Style, color_system: ColorSystem) -> Style:
+    """Downgrade the colors of a style to palette entries of the color system.
+
+    Results are kept in the process-wide `DOWNGRADE_CACHE`, so each style is \
+downgraded once per color system rather than once per render.
+
+    Args:
+        style (Style): The style to downgrade.
+        color_system (ColorSystem): The target color system.
+
+    Returns:
+        Style: The style with downgraded colors.
+    """
+    color, bgcolor = style.color, style.bgcolor
+    if color is None and bgcolor is None:
+        return style
+    key = (style, color_system)
+    downgraded = DOWNGRADE_CACHE.get(key)
+    if downgraded is None:
+        downgraded = DOWNGRADE_CACHE.set(
+            key,
+            style
+            + Style(
+                color=downgrade_color(color, color_system) if color else None,
+                bgcolor=downgrade_color(bgcolor, color_system) if bgcolor else None,
+            ),
+        )
+    return downgraded
+
+
+def downgrade_styles(styles: Iterable[Style], color_system: ColorSystem) -> List[Style]:
+    """Downgrade many styles, e.g. a table of gradient styles.
+
+    Args:
+        styles (Iterable[Style]): The styles to downgrade.
+        color_system (ColorSystem): The target color system.
+
+    Returns:
+        List[Style]: The downgraded styles, in order.
+    """
+    return [downgrade_style(style, color_system) for style in styles]
+
+
+def quantize_spans(spans: List[Span], color_system: ColorSystem) -> List[Span]:
+    """Downgrade the colors of spans to a color system and merge the runs.
+
+    Styles are downgraded through the `DOWNGRADE_CACHE`. Consecutive spans \
+that touch and end up with the same palette entry are merged into a single \
+span.
+
+    Args:
+        spans (List[Span]): The spans to quantize.
+        color_system (ColorSystem): The target color system.
+
+    Returns:
+        List[Span]: The quantized spans.
+    """
+    quantized: List[Span] = []
+    for span in spans:
+        style = span.style
+        if isinstance(style, Style):
+            style = downgrade_style(style, color_system)
+        if quantized:
+            last = quantized[-1]
+            if last.end == span.start and last.style == style:
+                quantized[-1] = Span(last.start, span.end, style)
+                continue
+        quantized.append(Span(span.start, span.end, style))
+    return quantized
@@ -17,6 +17,15 @@ from rich.style import Style, StyleType
 from rich.text import Span, Text
 
 from rich_gradient import Color, ColorType, Log, get_log, DEFAULT_STYLES, Spectrum
+from rich_gradient._lazy import LazySpans, materialize_spans
+from rich_gradient._measure import cached_measure
+from rich_gradient._ramp import (
+    cached_ramp,
+    quantize_spans,
+    quantized_color_system,
+    ramp_spans,
+    ramp_stops,
+)
 
 GradientMethod = Literal["default", "list", "mono", "rainbow"]
 DEFAULT_JUSTIFY: JustifyMethod = "default"
@@ -40,6 +49,10 @@ class SimpleGradient(Text):
         no_wrap (bool, optional): Disable wrapping. Defaults to False.
         style (StyleType, optional): The style of the gradient text. Defaults to None.
         end (str, optional): The end character. Defaults to " ".
+        merge_spans (bool, optional): Merge consecutive characters of the same \
+color into a single span. Defaults to False.
+        lazy (bool, optional): Defer computing the spans until they are first \
+rendered or accessed. Defaults to False.
     """
 
     __slots__ = (
@@ -48,11 +61,16 @@ class SimpleGradient(Text):
         "_text",
         "_length",
         "_style",
-        "_spans",
+        "_spans_pending",
+        "_gradient_styles",
         "end",
         "verbose",
+        "merge_spans",
+        "_measure_cache",
     )
 
+    _spans = LazySpans()
+
     def __init__(
         self,
         text: str | Text = "",
@@ -66,8 +84,11 @@ class SimpleGradient(Text):
         end: str = "",
         spans: Optional[List[Span]] = None,
         verbose: bool = False,
+        merge_spans: bool = False,
+        lazy: bool = False,
     ) -> None:
         self.verbose = verbose
+        self.merge_spans = merge_spans
         self.text = text  # type: ignore
         _style = Style.parse(style) if isinstance(style, str) else style
 
@@ -88,7 +109,10 @@ class SimpleGradient(Text):
 
         self.color1 = Color(color1)
         self.color2 = Color(color2)
-        self._spans = list(self.generate_spans())
+        if lazy:
+            self._spans_pending = True
+        else:
+            materialize_spans(self)
 
     def __repr__(self) -> str:
         return f"SimpleGradient({self.text!r}, \
@@ -178,23 +202,9 @@ class SimpleGradient(Text):
         """
         if self.verbose:
             console.log("Entered generate_gradient")
-        triplet1 = self.color1.triplet
-        r1, g1, b1 = triplet1
-        triplet2 = self.color2.triplet
-        r2, g2, b2 = triplet2
-        dr: int = r2 - r1
-        dg: int = g2 - g1
-        db: int = b2 - b1
-
-        for index in range(self._length):
-            blend: float = index / self._length
-            red: int = int(r1 + (dr * blend))
-            green: int = int(g1 + (dg * blend))
-            blue: int = int(b1 + (db * blend))
-            hex_str: str = f"#{red:02X}{green:02X}{blue:02X}"
-            color = Color(hex_str)
-            style = color.style + self._style
-            yield Span(index, index + 1, style=style)
+        stops = ramp_stops([self.color1, self.color2])
+        ramp = cached_ramp(stops, self._length)
+        yield from ramp_spans(ramp, self._style, merge=self.merge_spans)
 
     def __rich_console__(
         self, console: "Console", options: "ConsoleOptions"
@@ -204,7 +214,13 @@ class SimpleGradient(Text):
 
         overflow = self.overflow or options.overflow or DEFAULT_OVERFLOW
 
-        lines = self.wrap(
+        text: Text = self
+        color_system = quantized_color_system(console)
+        if color_system is not None:
+            text = self.copy()
+            text.spans = quantize_spans(self._spans, color_system)
+
+        lines = text.wrap(
             console,
             options.max_width,
             justify=justify,
@@ -218,14 +234,7 @@ class SimpleGradient(Text):
     def __rich_measure__(
         self, console: "Console", options: "ConsoleOptions"
     ) -> Measurement:
-        text: str = self.plain
-        lines: List[str] = text.splitlines()
-        max_text_width = max(cell_len(line) for line in lines) if lines else 0
-        words = text.split()
-        min_text_width = (
-            max(cell_len(word) for word in words) if words else max_text_width
-        )
-        return Measurement(min_text_width, max_text_width)
+        return cached_measure(self)
 
     def render(self, console: "Console", end: str = "") -> Iterable["Segment"]:
         """Render the text as Segments.
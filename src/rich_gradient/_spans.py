@@ -0,0 +1,123 @@
+"""Merge the spans of a text with the spans of its gradient."""
+
+from __future__ import annotations
+
+from heapq import merge
+from typing import Callable, Dict, List, Optional, Tuple
+
+from rich.errors import StyleSyntaxError
+from rich.style import Style, StyleType
+from rich.text import Span
+
+StyleGetter = Callable[[StyleType], Style]
+
+
+def parse_style(style: StyleType) -> Style:
+    """Parse a span's style without a console, ignoring theme style names.
+
+    Args:
+        style (StyleType): The style, or a style definition.
+
+    Returns:
+        Style: The parsed style, or a null style if it cannot be parsed.
+    """
+    if isinstance(style, Style):
+        return style
+    try:
+        return Style.parse(style)
+    except StyleSyntaxError:
+        return Style.null()
+
+
+def sweep_spans(
+    gradient_spans: List[Span],
+    user_spans: List[Span],
+    get_style: Optional[StyleGetter] = None,
+) -> List[Span]:
+    """Combine a gradient's spans with other spans in a single sorted sweep.
+
+    The gradient's spans must be sorted and must not overlap, as generated. \
+The other spans may overlap and come in any order; like in `Text.render`, a \
+span later in the list takes precedence. The result has no overlapping spans, \
+and touching spans of equal style are merged, so it renders the same as the \
+stacked spans with the least work. The sweep costs O(n + m log m) for n \
+gradient spans and m other spans.
+
+    Args:
+        gradient_spans (List[Span]): The sorted spans of the gradient.
+        user_spans (List[Span]): The spans to layer on top of the gradient.
+        get_style (StyleGetter, optional): Resolves a span's style, e.g. a \
+console's `get_style`, to look up theme styles. Defaults to None, which \
+parses style definitions.
+
+    Returns:
+        List[Span]: The combined spans.
+    """
+    get_style = get_style or parse_style
+    events: List[Tuple[int, int, int]] = []
+    for index, span in enumerate(user_spans):
+        if span.end > span.start:
+            # Spans ending at an offset are removed before those starting there.
+            events.append((span.start, 1, index))
+            events.append((span.end, 0, index))
+    events.sort()
+    if not events:
+        return list(gradient_spans)
+
+    parsed: Dict[StyleType, Style] = {}
+
+    def resolve(style: StyleType) -> Style:
+        resolved = parsed.get(style)
+        if resolved is None:
+            resolved = parsed[style] = get_style(style)
+        return resolved
+
+    user_styles = [resolve(span.style) for span in user_spans]
+    combined: Dict[Tuple[Optional[Style], Tuple[int, ...]], Style] = {}
+    cuts = merge(
+        (offset for span in gradient_spans for offset in (span.start, span.end)),
+        (offset for offset, _, _ in events),
+    )
+
+    spans: List[Span] = []
+    active: Dict[int, None] = {}
+    gradient_index = event_index = 0
+    left: Optional[int] = None
+    for right in cuts:
+        if left is None or right == left:
+            left = right
+            continue
+        while event_index < len(events) and events[event_index][0] <= left:
+            _, starting, index = events[event_index]
+            if starting:
+                active[index] = None
+            else:
+                active.pop(index, None)
+            event_index += 1
+        while (
+            gradient_index < len(gradient_spans)
+            and gradient_spans[gradient_index].end <= left
+        ):
+            gradient_index += 1
+        gradient_style: Optional[Style] = None
+        if (
+            gradient_index < len(gradient_spans)
+            and gradient_spans[gradient_index].start <= left
+        ):
+            gradient_style = resolve(gradient_spans[gradient_index].style)
+
+        if gradient_style is not None or active:
+            key = (gradient_style, tuple(sorted(active)))
+            style = combined.get(key)
+            if style is None:
+                layers = [user_styles[index] for index in key[1]]
+                if gradient_style is not None:
+                    layers.insert(0, gradient_style)
+                style = combined[key] = Style.combine(layers)
+            last = spans[-1] if spans else None
+            if last is not None and last.end == left and last.style == style:
+                spans[-1] = Span(last.start, right, style)
+            else:
+                spans.append(Span(left, right, style))
+        left = right
+    return spans
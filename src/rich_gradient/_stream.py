@@ -0,0 +1,142 @@
+"""Stream gradient colored text chunk by chunk with bounded memory."""
+
+# ruff: noqa: F401
+from __future__ import annotations
+
+from typing import (
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+import numpy as np
+from pydantic_extra_types.color import ColorType
+from rich.color import ColorSystem
+from rich.console import COLOR_SYSTEMS
+from rich.control import strip_control_codes
+from rich.segment import Segment
+from rich.style import Style, StyleType
+
+from rich_gradient._ramp import (
+    QUANTIZED_SYSTEMS,
+    cached_ramp,
+    color_style,
+    downgrade_style,
+    gradient_stops,
+    ramp_runs,
+    ramp_stops,
+    ramp_window,
+)
+
+ColorSystemName = Literal["standard", "256", "truecolor", "windows"]
+DEFAULT_CYCLE_LENGTH: int = 80
+
+
+def stream(
+    chunks: Iterable[str],
+    colors: Optional[Sequence[ColorType]] = None,
+    total_length: Optional[int] = None,
+    *,
+    style: StyleType = Style.null(),
+    cycle_length: int = DEFAULT_CYCLE_LENGTH,
+    ansi: bool = False,
+    color_system: ColorSystemName = "truecolor",
+) -> Iterator[Union[Segment, str]]:
+    """Color a stream of text chunks with a gradient, one chunk at a time.
+
+    Only the colors of the current chunk are ever computed, so arbitrarily \
+large files or endless streams can be colored in constant memory.
+
+    Args:
+        chunks (Iterable[str]): The chunks of text, e.g. an open file.
+        colors (Sequence[ColorType], optional): The colors of the gradient. \
+Defaults to None, which uses the first colors of the spectrum.
+        total_length (int, optional): The total number of characters in the \
+stream. If given, the gradient spans the whole stream once. Defaults to \
+None, which repeats a gradient cycling through the colors and back every \
+`cycle_length` characters.
+        style (StyleType): A style applied beneath the gradient. Defaults to \
+`Style.null()`.
+        cycle_length (int): The length of one cycle when the total length is \
+unknown. Defaults to 80.
+        ansi (bool): Yield ANSI escaped strings instead of `Segment`s. \
+Defaults to False.
+        color_system (ColorSystemName): The color system of the ANSI output. \
+Defaults to "truecolor".
+
+    Yields:
+        Segment | str: The colored pieces of each chunk. Newlines are \
+yielded unstyled.
+    """
+    color_stops = gradient_stops(colors)
+    if cycle_length < 2:
+        raise ValueError("The cycle length must be at least two.")
+    stops = ramp_stops(color_stops)
+    base_style = Style.parse(style) if isinstance(style, str) else style
+    system = COLOR_SYSTEMS[color_system]
+
+    cycle: Optional[np.ndarray] = None
+    if total_length is None:
+        # Return to the first color so that consecutive cycles join smoothly.
+        cycle = cached_ramp((*stops, stops[0]), cycle_length)
+    stops_array = np.array(stops, dtype=np.int64)
+
+    offset = 0
+    for chunk in chunks:
+        text = strip_control_codes(chunk)
+        if not text:
+            continue
+        end = offset + len(text)
+        if cycle is not None:
+            ramp = cycle[np.arange(offset, end) % cycle_length]
+        else:
+            assert total_length is not None
+            ramp = ramp_window(stops_array, total_length, offset, end)
+            if len(ramp) < len(text):
+                # Characters past the announced length keep the last color.
+                last = ramp_window(
+                    stops_array, total_length, total_length - 1, total_length
+                )
+                if not len(last):
+                    last = stops_array[-1:].astype(np.uint8)
+                ramp = np.concatenate(
+                    [ramp, np.repeat(last, len(text) - len(ramp), axis=0)]
+                )
+        offset = end
+
+        yield from _render_runs(text, ramp, base_style, system if ansi else None)
+
+
+def _render_runs(
+    text: str, ramp: np.ndarray, style: Style, system: Optional[ColorSystem]
+) -> Iterator[Union[Segment, str]]:
+    """Yield the runs of a colored chunk as segments, or as ANSI strings if \
+a color system is given."""
+    pieces: List[Tuple[Style, str]] = []
+    runs = ramp_runs(ramp).tolist()
+    for (red, green, blue), start, stop in zip(
+        ramp[runs[:-1]].tolist(), runs, runs[1:]
+    ):
+        run_style = color_style(red, green, blue, style)
+        if system in QUANTIZED_SYSTEMS:
+            run_style = downgrade_style(run_style, system)
+        if pieces and pieces[-1][0] == run_style:
+            pieces[-1] = (run_style, pieces[-1][1] + text[start:stop])
+        else:
+            pieces.append((run_style, text[start:stop]))
+
+    for run_style, piece in pieces:
+        for index, line in enumerate(piece.split("\n")):
+            if index:
+                yield "\n" if system is not None else Segment.line()
+            if line:
+                yield (
+                    run_style.render(line, color_system=system)
+                    if system is not None
+                    else Segment(line, run_style)
+                )
@@ -16,9 +16,7 @@ eg. `Color((0, 255, 255)).as_named() == 'cyan'` because "cyan" comes after "aqua
 # ruff: noqa: F401
 import math
 import re
-from itertools import cycle
-from random import randint
-from typing import Any, Dict, Generator, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Dict, Generator, List, Optional, Tuple
 
 from pydantic_extra_types.color import RGBA
 from pydantic_extra_types.color import Color as PyColor
@@ -31,6 +29,9 @@ from rich.table import Table
 from rich.text import Text
 from rich.color_triplet import ColorTriplet
 
+if TYPE_CHECKING:
+    from rich_gradient.spectrum import RandomGradientSource
+
 
 class Color(PyColor):
     def __init__(self, value: PyColorType) -> None:
@@ -272,39 +273,24 @@ class Color(PyColor):
             return Color("#000000").rich
 
     @classmethod
-    def colortitle(cls, title: str) -> Text:
-        """Return the colored title."""
-        title_list: List[str] = list(title)
-        length = len(title)
-        COLORS = cycle(
-            [
-                "#FF00FF",
-                "#AF00FF",
-                "#5F00FF",
-                "#0000FF",
-                "#0055FF",
-                "#0080FF",
-                "#00C0FF",
-                "#00FFFF",
-                "#00FFAF",
-                "#00FF00",
-                "#AFFF00",
-                "#FFFF00",
-                "#FFAF00",
-                "#FF8700",
-                "#FF4B00",
-                "#FF0000",
-                "#FF005F",
-            ]
-        )
+    def colortitle(
+        cls, title: str, source: Optional["RandomGradientSource"] = None
+    ) -> Text:
+        """Return the title colored through the spectrum, from a random start.
+
+        Args:
+            title (str): The title to color.
+            source (RandomGradientSource, optional): The source of the random \
+start and direction. Defaults to None, which uses the shared, unseeded \
+source. Pass a seeded source for reproducible titles.
+        """
+        # `rich_gradient.spectrum` imports this module, so import it here.
+        from rich_gradient.spectrum import RANDOM_GRADIENTS, Spectrum
+
+        view = (source or RANDOM_GRADIENTS).view(len(title))
         color_title = Text()
-        # randomize
-        for _ in range(randint(0, 16)):
-            next(COLORS)
-        for index in range(length):
-            char: str = title_list[index]
-            color: str = next(COLORS)
-            color_title.append(Text(char, style=f"bold {color}"))
+        for char, index in zip(title, view.indexes().tolist()):
+            color_title.append(char, style=f"bold {Spectrum.HEX[index]}")
         return color_title
 
     @classmethod
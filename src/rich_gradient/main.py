@@ -4,16 +4,22 @@ console in gradient color."""
 # ruff: noqa: F401
 from __future__ import annotations
 
+import io
 import re
+from functools import partial
 from pathlib import Path
-from typing import List, Literal, Optional, Tuple, TypeAlias, Union
+from typing import Dict, Iterable, List, Literal, Optional, Tuple, TypeAlias, Union
 
 import numpy as np
 from pydantic_core import PydanticCustomError
 from pydantic_extra_types.color import ColorType as PyColorType
-from rich.console import Console, JustifyMethod, OverflowMethod
+from rich._pick import pick_bool
+from rich.color import ColorSystem
+from rich.console import Console, ConsoleOptions, JustifyMethod, OverflowMethod
 from rich.control import strip_control_codes
+from rich.measure import Measurement
 from rich.panel import Panel
+from rich.segment import Segment, Segments
 from rich.style import Style, StyleType
 from rich.text import Span, Text, TextType
 
@@ -25,15 +31,49 @@ from rich_gradient import (
     Log,
     GRADIENT_TERMINAL_THEME,
 )
+from rich_gradient._ansi import COLOR_SYSTEM_NAMES, color_system_of, encode_ansi
+from rich_gradient._cells import cell_columns
+from rich_gradient._compact import CompactSpans
+from rich_gradient._lazy import (
+    DeferredSpans,
+    LazySpans,
+    compact_spans,
+    raw_spans,
+    split_spans,
+    store_compact,
+    store_spans,
+)
+from rich_gradient._measure import cached_measure
+from rich_gradient._ramp import (
+    INTERPOLATIONS,
+    RAINBOW_PHASE,
+    RAINBOW_SPAN,
+    Interpolation,
+    batch_ramps,
+    cached_ramp,
+    quantize_spans,
+    quantized_color_system,
+    rainbow_ramp,
+    rainbow_window,
+    ramp_spans,
+    ramp_stops,
+    ramp_window,
+)
 from rich_gradient._simple_gradient import SimpleGradient
+from rich_gradient._spans import sweep_spans
+from rich_gradient.spectrum import RANDOM_GRADIENTS, SPECTRUM, RandomGradientSource
 
 GradientMode = Literal["default", "list", "mono", "rainbow"]
+GradientWrap = Literal["line", "block"]
+GradientDistribution = Literal["index", "cells"]
 GradientColors: TypeAlias = Union[
     Optional[List[ColorType]], Optional[list[Color]], Optional[List[str]]
 ]
 DEFAULT_JUSTIFY: JustifyMethod = "default"
 DEFAULT_OVERFLOW: OverflowMethod = "fold"
 DEFAULT_GRADIENT_MODE: GradientMode = "default"
+LINE_CACHE_SIZE: int = 8
+
 
 WHITESPACE_REGEX = re.compile(r"^\s+$")
 
@@ -61,6 +101,29 @@ class Gradient(Text):
             `console.tab_size`. Defaults to 4.
         spans (List[Span], optional): A list of predefined style spans.
             Defaults to None.
+        merge_spans (bool): Whether to merge consecutive characters of the same
+            color into a single span. Defaults to False.
+        lazy (bool): Whether to defer computing the gradient's spans until they
+            are first rendered or accessed. Defaults to False.
+        wrap_gradient (GradientWrap, optional): Apply the gradient after the
+            text is wrapped, either to each "line" or across the whole "block".
+            Defaults to None, which colors the text by character index.
+        interpolation (Interpolation): The color space to blend the colors in:
+            "rgb", or the perceptual "oklab" and "lch". Defaults to "rgb".
+        rainbow_phase (float): The hue of the first character in rainbow mode,
+            in degrees. Defaults to 300, magenta.
+        rainbow_span (float): The degrees the hue turns across the text in
+            rainbow mode. Defaults to -330.
+        random_source (RandomGradientSource, optional): Where to draw random
+            colors from when none are given. Defaults to None, which uses the
+            shared, unseeded source.
+        distribute (GradientDistribution): Spread the colors by character
+            "index", or by the terminal "cells" the text is displayed in, so
+            wide characters and grapheme clusters get one color each.
+            Defaults to "index".
+        background (bool): Color the background of the text with the gradient,
+            and the text itself black or white, whichever contrasts more.
+            Defaults to False.
 
 
             .. [1] colors: List[Optional[Color|Tuple|str|int]
@@ -79,11 +142,25 @@ class Gradient(Text):
         "_overflow",
         "style",
         "_style",
-        "_spans",
+        "_spans_pending",
+        "_gradient_styles",
         "_rainbow",
         "verbose",
+        "merge_spans",
+        "wrap_gradient",
+        "_line_cache",
+        "interpolation",
+        "rainbow_phase",
+        "rainbow_span",
+        "random_source",
+        "_measure_cache",
+        "distribute",
+        "background",
+        "_compact_spans",
     ]
 
+    _spans = LazySpans()
+
     def __init__(
         self,
         text: str | Text = "",
@@ -99,6 +176,15 @@ class Gradient(Text):
         tab_size: Optional[int] = 4,
         verbose: bool = False,
         spans: Optional[List[Span]] = None,
+        merge_spans: bool = False,
+        lazy: bool = False,
+        wrap_gradient: Optional[GradientWrap] = None,
+        interpolation: Interpolation = "rgb",
+        rainbow_phase: float = RAINBOW_PHASE,
+        rainbow_span: float = RAINBOW_SPAN,
+        random_source: Optional[RandomGradientSource] = None,
+        distribute: GradientDistribution = "index",
+        background: bool = False,
     ) -> None:
         """
         Text styled with gradient color.
@@ -123,20 +209,46 @@ class Gradient(Text):
                 `console.tab_size`. Defaults to 4.\n
             spans (List[Span], optional): A list of predefined style spans.\
                 Defaults to None.\n
+            merge_spans (bool): Whether to merge consecutive characters of the\
+                same color into a single span. Defaults to False.\n
+            lazy (bool): Whether to defer computing the gradient's spans until\
+                they are first rendered or accessed. Defaults to False.\n
+            wrap_gradient (GradientWrap, optional): Apply the gradient after\
+                wrapping, to each "line" or across the "block". Defaults to None.\n
+            interpolation (Interpolation): The color space to blend the colors\
+                in: "rgb", "oklab" or "lch". Defaults to "rgb".\n
+            rainbow_phase (float): The hue of the first character in rainbow\
+                mode, in degrees. Defaults to 300.\n
+            rainbow_span (float): The degrees the hue turns across the text in\
+                rainbow mode. Defaults to -330.\n
+            random_source (RandomGradientSource, optional): Where to draw random\
+                colors from when none are given. Defaults to None.\n
+            distribute (GradientDistribution): Spread the colors by character\
+                "index" or by terminal "cells". Defaults to "index".\n
+            background (bool): Color the background with the gradient, under\
+                contrasting text. Defaults to False.\n
 
         """
 
         self.verbose = verbose or False
+        self.merge_spans = merge_spans
+        self.wrap_gradient = wrap_gradient
+        if interpolation not in INTERPOLATIONS:
+            raise ValueError(f"Unknown interpolation: {interpolation!r}")
+        self.interpolation = interpolation
+        self.random_source = random_source
+        self.distribute = distribute
+        self.background = background
         self.text = text  # type: ignore
         self.hues = hues
         self.justify = justify or DEFAULT_JUSTIFY
         self.overflow = overflow or DEFAULT_OVERFLOW
         self.style = Style.parse(style) if isinstance(style, str) else style
         self.colors = self.validate_colors(colors or [], rainbow=rainbow)  # type: ignore
-        if len(self.colors) > 2:
-            self.hues = len(self.colors)
-        else:
-            self.hues = hues
+        self.hues = len(self.colors)
+        self._rainbow = rainbow and not colors
+        self.rainbow_phase = rainbow_phase
+        self.rainbow_span = rainbow_span
         self.verbose = verbose
 
         super().__init__(
@@ -147,22 +259,26 @@ class Gradient(Text):
             no_wrap=no_wrap,
             end=end or "\n",
             tab_size=tab_size or 4,
-            spans=spans,
+            # Keep the spans of a `Text`, e.g. from markup, above the gradient.
+            spans=[*(text.spans if isinstance(text, Text) else []), *(spans or [])],
         )
-        indexes = self.generate_indexes()
-        substrings = self.generate_substrings(indexes)
-        subgradients = self.generate_subgradients(substrings)
-        self._spans = self.join_subgradients(subgradients).spans
+        if lazy or wrap_gradient is not None:
+            self._spans_pending = True
+        else:
+            store_compact(self, self.generate_compact_spans())
 
     @property
     def text(self) -> str:
         """
-        Returns the concatenated string representation of the `_text` attribute.
+        Returns the text of the gradient.
+
+        The text is stored as a single string, as `Text.plain` keeps it, so \
+reading it does not join anything unless text was appended since.
 
         Returns:
-            str: The concatenated string representation of the `_text` attribute.
+            str: The text of the gradient.
         """
-        return "".join(self._text) if isinstance(self._text, list) else self._text
+        return self.plain
 
     @text.setter
     def text(self, value: Optional[str] | Optional[Text]) -> None:
@@ -175,14 +291,15 @@ class Gradient(Text):
         Returns:
             None
         """
+        self._line_cache = {}
         if isinstance(value, Text):
             self._length = value._length
-            self._text = value._text
+            self._text = [value.plain]
             self._spans = value.spans
         elif isinstance(value, str):
             sanitized_text = strip_control_codes(value)
             self._length = len(sanitized_text)
-            self._text = list(sanitized_text)
+            self._text = [sanitized_text]
         elif value is None:
             raise ValueError("Text cannot be None.")
         else:
@@ -251,6 +368,8 @@ class Gradient(Text):
         """
         self._colors = self.validate_colors(values)
         self._hues = len(self._colors)
+        self._rainbow = False
+        self._line_cache = {}
 
     def validate_colors(
         self,
@@ -274,22 +393,12 @@ class Gradient(Text):
         _colors: List[Color] = []
         if colors is None or colors == []:
             if not rainbow:
-                color_list = Spectrum()
-                for index, color in enumerate(color_list):
-                    _colors.append(color)
-                    if index == self.hues - 1:
-                        break
-                return _colors
+                source = getattr(self, "random_source", None) or RANDOM_GRADIENTS
+                return source.colors(self.hues)
             else:
-                self.hues = 20
-                if self._length < 20:
-                    self.hues = self._length
-                color_list = Spectrum()
-                for index, color in enumerate(color_list):
-                    _colors.append(color)
-                    if index == self.hues - 1:
-                        break
-                return _colors
+                # Rainbow text is colored from the hue wheel, so the colors are
+                # informational only.
+                return list(SPECTRUM)
         elif isinstance(colors, tuple):
             for color in colors:
                 try:
@@ -301,6 +410,8 @@ class Gradient(Text):
             assert len(_colors) >= 2, "Gradient must have at least two colors."
             return _colors
         elif isinstance(colors, list):
+            if len(colors) >= 2 and all(isinstance(color, Color) for color in colors):
+                return list(colors)  # type: ignore[arg-type]
             for color in colors:  # type: ignore
                 try:
                     color = Color(color)
@@ -332,55 +443,600 @@ class Gradient(Text):
         """
         self._spans = spans
 
-    def generate_indexes(self) -> List[List[int]]:
-        """Chunk the text into a list of strings.
+    def generate_spans(self) -> List[Span]:
+        """Generate the gradient's spans.
+
+        The colors of every character are interpolated across all of the \
+gradient's colors at once, and a span is emitted per character, or per run \
+of same-colored characters if `merge_spans` is set.
 
         Returns:
-            List[str]: The list of strings.
+            List[Span]: The gradient's spans.
         """
-        # if self.verbose:
-        #     console.log(f"Text: {self.text}")
-        #     console.log(f"Length: {self._length}")
-        #     console.log(f"Hues: {self.hues}")
-        result = np.array_split(np.arange(self._length), self.hues - 1)  # noqa: F722
+        return ramp_spans(
+            self.color_ramp(),
+            self._base_style(),
+            merge=self.merge_spans,
+            background=self.background,
+        )
 
-        indexes: List[List[int]] = [sublist.tolist() for sublist in result]
-        # if self.verbose:
-        #     index_text = Text(" ".join([f"{index}" for index in indexes]))
-        #     console.print(index_text)
-        return indexes
+    def generate_compact_spans(self) -> CompactSpans:
+        """Generate the gradient's spans in compact form.
 
-    def generate_substrings(self, indexes: List[List[int]]) -> List[str]:
-        """Split the text into substrings based on the indexes.
+        The spans are the same as those of `generate_spans()`, kept as arrays \
+of offsets and palette indexes. `Span` objects are only built when the \
+text's spans are read.
+
+        Returns:
+            CompactSpans: The gradient's spans.
+        """
+        return CompactSpans.from_ramp(
+            self.color_ramp(),
+            self._base_style(),
+            merge=self.merge_spans,
+            background=self.background,
+        )
+
+    def _gradient_span_list(
+        self, color_system: Optional[ColorSystem] = None
+    ) -> List[Span]:
+        """The gradient's spans, built without storing them on the text.
+
+        Args:
+            color_system (ColorSystem, optional): A color system to quantize \
+the spans for. Defaults to None, which keeps the truecolor spans.
+        """
+        if not self._spans_pending:
+            spans = split_spans(self)[0]
+            if color_system is not None:
+                spans = quantize_spans(spans, color_system)
+            return spans
+        compact = compact_spans(self)
+        if compact is None:
+            compact = self.generate_compact_spans()
+            store_compact(self, compact)
+        if color_system is not None:
+            compact = compact.quantize(color_system)
+        return compact.to_spans()
+
+    def color_ramp(self, length: Optional[int] = None) -> np.ndarray:
+        """The color of every character of the gradient.
 
         Args:
-            indexes (List[List[int]]): The indexes to split the text on.
+            length (int, optional): The number of characters to color. \
+Defaults to None, which uses the length of the text.
 
         Returns:
-            List[str]: The list of substrings.
+            np.ndarray: A `(length, 3)` array of `uint8` RGB values.
+        """
+        if length is None:
+            length = self._length
+            if self.distribute == "cells":
+                columns, width = cell_columns(self.plain)
+                if width:
+                    ramp = self._index_ramp(width)
+                    return ramp[np.minimum(columns, width - 1)]
+        return self._index_ramp(length)
+
+    def _index_ramp(self, length: int) -> np.ndarray:
+        """The colors of a ramp of `length` positions."""
+        if self._rainbow:
+            return rainbow_ramp(length, self.rainbow_phase, self.rainbow_span)
+        return cached_ramp(ramp_stops(self.colors), length, self.interpolation)
+
+    def _ramp_window(self, length: int, start: int, stop: int) -> np.ndarray:
+        """The colors of positions `start` to `stop` of a ramp of `length`."""
+        if self.distribute == "cells":
+            return self.color_ramp()[start:stop]
+        if self._rainbow:
+            return rainbow_window(
+                length, start, stop, self.rainbow_phase, self.rainbow_span
+            )
+        stops = np.array(ramp_stops(self.colors), dtype=np.int64)
+        return ramp_window(stops, length, start, stop, self.interpolation)
+
+    def _base_style(self) -> Style:
+        """The gradient's style, parsed if it was given as a string."""
+        return Style.parse(self.style) if isinstance(self.style, str) else self.style
+
+    def _user_spans(self) -> List[Span]:
+        """The spans that are not part of the gradient."""
+        return split_spans(self)[1]
+
+    def append_text(self, text: TextType, *, rescale: bool = False) -> "Gradient":
+        """Append text to the gradient, coloring only what is needed.
+
+        Args:
+            text (str | Text): The text to append. The spans of a `Text` are \
+kept on top of the gradient.
+            rescale (bool): Stretch the gradient over the whole new text. \
+Defaults to False, which keeps the colors of the existing characters and \
+only colors the appended tail, continuing the ramp of the new length.
+
+        Returns:
+            Gradient: The gradient itself, for chaining.
+        """
+        return self.extend([text], rescale=rescale)
+
+    def extend(self, texts: Iterable[TextType], *, rescale: bool = False) -> "Gradient":
+        """Append several texts to the gradient at once.
+
+        Args:
+            texts (Iterable[str | Text]): The texts to append.
+            rescale (bool): Stretch the gradient over the whole new text. \
+Defaults to False, which only colors the appended tail.
+
+        Returns:
+            Gradient: The gradient itself, for chaining.
+        """
+        offset = self._length
+        end = offset
+        pieces: List[str] = []
+        user_spans: List[Span] = []
+        for text in texts:
+            if isinstance(text, str):
+                text = Text(text)
+            length = len(text)
+            if not length:
+                continue
+            if text.style:
+                user_spans.append(Span(end, end + length, text.style))
+            user_spans.extend(
+                Span(end + start, end + stop, style)
+                for start, stop, style in text._spans
+            )
+            pieces.append(text.plain)
+            end += length
+        if end == offset:
+            return self
+
+        self._text.append("".join(pieces))
+        self._length = end
+        if self._spans_pending:
+            compact = compact_spans(self)
+            if compact is not None:
+                if rescale:
+                    compact = self.generate_compact_spans()
+                else:
+                    compact = compact.concatenate(
+                        CompactSpans.from_ramp(
+                            self._ramp_window(end, offset, end),
+                            self._base_style(),
+                            self.merge_spans,
+                            offset,
+                            self.background,
+                        )
+                    )
+                store_compact(self, compact)
+            raw_spans(self).extend(user_spans)
+            return self
+
+        gradient_spans, other_spans = split_spans(self)
+        style = self._base_style()
+        if rescale:
+            ramp = self.color_ramp(end)
+            gradient_spans = ramp_spans(
+                ramp, style, self.merge_spans, background=self.background
+            )
+        else:
+            gradient_spans += ramp_spans(
+                self._ramp_window(end, offset, end),
+                style,
+                self.merge_spans,
+                offset,
+                self.background,
+            )
+        self._spans = other_spans + user_spans
+        store_spans(self, gradient_spans)
+        return self
+
+    @classmethod
+    def batch(
+        cls,
+        texts: Iterable[str | Text],
+        colors: GradientColors = None,
+        *,
+        rainbow: bool = False,
+        hues: int = 4,
+        style: StyleType = Style.null(),
+        merge_spans: bool = False,
+        lazy: bool = False,
+        wrap_gradient: Optional[GradientWrap] = None,
+        **kwargs,
+    ) -> List["Gradient"]:
+        """Create gradients for many texts at once, e.g. the cells of a table.
+
+        The colors are validated once, and the ramps of all the texts are \
+computed in a single vectorized pass over their lengths.
+
+        Args:
+            texts (Iterable[str | Text]): The texts to color.
+            colors (GradientColors): The colors shared by every gradient. \
+Defaults to None.
+            rainbow (bool): Whether to use rainbow colors. Defaults to False.
+            hues (int): The number of colors if none are given. Defaults to 4.
+            style (StyleType): The style of every gradient. Defaults to \
+`Style.null()`.
+            merge_spans (bool): Whether to merge same-colored characters into \
+a single span. Defaults to False.
+            lazy (bool): Whether to defer computing the spans until each \
+gradient is first used. Defaults to False.
+            wrap_gradient (GradientWrap, optional): Apply the gradient after \
+wrapping. Defaults to None.
+            **kwargs: Other keyword arguments passed to every `Gradient`.
+
+        Returns:
+            List[Gradient]: One gradient per text, in order.
+        """
+        texts = list(texts)
+        if not texts:
+            return []
+        first = cls(
+            texts[0],
+            colors,
+            rainbow=rainbow,
+            hues=hues,
+            style=style,
+            merge_spans=merge_spans,
+            lazy=True,
+            wrap_gradient=wrap_gradient,
+            **kwargs,
+        )
+        gradients = [first] + [
+            cls(
+                text,
+                None if first._rainbow else first.colors,
+                rainbow=first._rainbow,
+                style=style,
+                merge_spans=merge_spans,
+                lazy=True,
+                wrap_gradient=wrap_gradient,
+                **kwargs,
+            )
+            for text in texts[1:]
+        ]
+        if lazy or wrap_gradient is not None:
+            return gradients
+
+        if first._rainbow or first.distribute == "cells":
+            ramps = [gradient.color_ramp() for gradient in gradients]
+        else:
+            stops = np.array(ramp_stops(first.colors), dtype=np.int64)
+            ramps = batch_ramps(
+                stops,
+                [gradient._length for gradient in gradients],
+                first.interpolation,
+            )
+        base_style = first._base_style()
+        for gradient, ramp in zip(gradients, ramps):
+            store_compact(
+                gradient,
+                CompactSpans.from_ramp(
+                    ramp, base_style, merge=merge_spans, background=first.background
+                ),
+            )
+        return gradients
+
+    def to_ansi(self, color_system: Union[ColorSystem, str, None] = "truecolor") -> str:
+        """Encode the gradient straight to ANSI escape sequences.
+
+        The escape sequences are written from the color ramp, bypassing \
+rich's segment pipeline, and a color is only emitted where it changes. The \
+text is not wrapped. Gradients with spans of their own, applied after \
+wrapping, under a style with a foreground color, which wins over the \
+gradient's, or with a background gradient under a background color, are \
+rendered through rich instead.
+
+        Args:
+            color_system (ColorSystem | str, optional): The color system to \
+encode for. Defaults to "truecolor".
+
+        Returns:
+            str: The gradient text with ANSI escape sequences.
+        """
+        system = color_system_of(color_system)
+        style = self._base_style()
+        if (
+            self.wrap_gradient is None
+            and not self._user_spans()
+            and style.color is None
+            and not (self.background and style.bgcolor)
+        ):
+            return encode_ansi(
+                self.plain, self.color_ramp(), style, system, self.background
+            )
+        console = Console(
+            file=io.StringIO(),
+            color_system=COLOR_SYSTEM_NAMES.get(system),  # type: ignore[arg-type]
+            force_terminal=True,
+            legacy_windows=False,
+            width=max(self.cell_len, 1),
+        )
+        with console.capture() as capture:
+            console.print(
+                GradientRenderable(self, end=""),
+                soft_wrap=self.wrap_gradient is None,
+            )
+        return capture.get()
+
+    def fast_print(self, console: Console, end: str = "\n") -> None:
+        """Print the gradient, writing its ANSI encoding directly when possible.
+
+        Single-line gradients that fit the console are written with \
+`to_ansi()`. Anything else, or consoles that record, export, are not \
+terminals or have colors turned off, falls back to `console.print()`.
+
+        Args:
+            console (Console): The console to print to.
+            end (str): The string written after the text. Defaults to "\\n".
+        """
+        justify = self.justify or DEFAULT_JUSTIFY
+        if (
+            console.color_system is None
+            or console.no_color
+            or console.record
+            or console.is_jupyter
+            or console.legacy_windows
+            or self.wrap_gradient is not None
+            or justify not in ("default", "left")
+            or "\n" in self.plain
+            or self.cell_len > console.width
+            or self._user_spans()
+        ):
+            console.print(GradientRenderable(self, end=end))
+            return
+        ansi = self.to_ansi(console.color_system)
+        console.print(Segments([Segment(ansi + end)]), end="", crop=False)
+
+    def __rich__(self) -> Union["GradientView", "GradientRenderable"]:
+        """Hand rich a view of the gradient that does not store its spans.
+
+        `Console.print` joins the `Text` instances it is given, with `sep` \
+and `end`, reading their spans. A `GradientView` is joined like the gradient \
+would be, without storing its spans on the gradient, and renders through \
+`__rich_console__` anywhere else. Gradients applied after wrapping cannot \
+be joined, and are printed through a `GradientRenderable` on their own.
+        """
+        if self.wrap_gradient is not None:
+            return GradientRenderable(self)
+        return GradientView(self)
+
+    def __rich_console__(
+        self, console: Console, options: ConsoleOptions
+    ) -> Iterable[Segment]:
+        """Render the gradient, quantizing its colors for limited terminals.
+
+        On `standard`, `256` and `windows` color consoles the gradient's \
+colors are downgraded once per distinct color, and neighboring characters \
+that land on the same palette entry are rendered as a single segment. \
+Spans held in compact form are built for the render only, and are not \
+stored on the gradient.
+        """
+        yield from self._render(console, options, self.end)
+
+    def _render(
+        self, console: Console, options: ConsoleOptions, end: str
+    ) -> Iterable[Segment]:
+        """Render the gradient as `__rich_console__` does, with another end.
+
+        Args:
+            console (Console): The console being rendered to.
+            options (ConsoleOptions): The console options.
+            end (str): The string written after the text.
+
+        Returns:
+            Iterable[Segment]: The rendered segments.
+        """
+        color_system = quantized_color_system(console)
+        if self.wrap_gradient is not None:
+            text = self.wrapped_text(console, options, color_system)
+            yield from text.render(console, end=end)
+            return
+        user_spans = self._user_spans()
+        if (
+            color_system is None
+            and not user_spans
+            and not self._spans_pending
+            and end == self.end
+        ):
+            yield from super().__rich_console__(console, options)
+            return
+        if not user_spans:
+            spans = self._gradient_span_list(color_system)
+        elif color_system is not None:
+            spans = quantize_spans(self.merged_spans(console), color_system)
+        else:
+            spans = self.merged_spans(console)
+        yield from self._render_copy(spans, end).__rich_console__(console, options)
+
+    def _render_copy(self, spans: List[Span], end: Optional[str] = None) -> Text:
+        """A plain `Text` copy of the gradient with other spans."""
+        return Text(
+            self.plain,
+            style=self.style,
+            justify=self.justify,
+            overflow=self.overflow,
+            no_wrap=self.no_wrap,
+            end=self.end if end is None else end,
+            tab_size=self.tab_size,
+            spans=spans,
+        )
+
+    def __rich_measure__(
+        self, console: Console, options: ConsoleOptions
+    ) -> Measurement:
+        """Measure the gradient, reusing the last measurement if unchanged."""
+        return cached_measure(self)
+
+    def merged_spans(self, console: Optional[Console] = None) -> List[Span]:
+        """Combine the gradient with the text's other spans.
+
+        The spans from markup, `highlight_regex()` or a `Text` passed to the \
+gradient are layered on top of the gradient in a single sorted sweep, into \
+the fewest spans that do not overlap.
+
+        Args:
+            console (Console, optional): The console used to look up theme \
+styles. Defaults to None, which parses style definitions.
+
+        Returns:
+            List[Span]: The combined spans.
         """
-        substrings: List[str] = []
-        slices: List[Tuple[int, int]] = []
+        get_style = (
+            partial(console.get_style, default=Style.null()) if console else None
+        )
+        return sweep_spans(self._gradient_span_list(), self._user_spans(), get_style)
+
+    def wrapped_text(
+        self,
+        console: Console,
+        options: ConsoleOptions,
+        color_system: Optional[ColorSystem] = None,
+    ) -> Text:
+        """Wrap the text, then apply the gradient to the wrapped lines.
 
-        # For each index get the first and last element
-        for index in indexes:
-            start = index[0]
-            end = index[-1] + 1
-            slices.append((start, end))  #  # Slice the text
+        The result is cached on the gradient, keyed by the width, justify \
+and overflow methods it was wrapped with, and by the text, style and spans \
+it was wrapped from, so reprinting at the same terminal width does not \
+recompute it.
 
-        # If the text is a list, join it into a single string
-        if isinstance(self.text, list):
-            text = " ".join(self.text)
-        elif isinstance(self.text, str):
-            text = self.text
+        Args:
+            console (Console): The console being rendered to.
+            options (ConsoleOptions): The console options.
+            color_system (ColorSystem, optional): Quantize the colors to this \
+color system. Defaults to None.
+
+        Returns:
+            Text: The wrapped lines joined with newlines.
+        """
+        tab_size: int = console.tab_size if self.tab_size is None else self.tab_size
+        justify = self.justify or options.justify or DEFAULT_JUSTIFY
+        overflow = self.overflow or options.overflow or DEFAULT_OVERFLOW
+        no_wrap = pick_bool(self.no_wrap, options.no_wrap, False)
+        width = options.max_width
+        key = (
+            width,
+            justify,
+            overflow,
+            no_wrap,
+            tab_size,
+            color_system,
+            self.wrap_gradient,
+            self.interpolation,
+            self.merge_spans,
+            self.background,
+            self.style,
+            # The text holds a single part once `plain` is read, and a
+            # mutated text holds a new one, as in `cached_measure`.
+            self.plain,
+            tuple(self._user_spans()),
+        )
+        cached = self._line_cache.get(key)
+        if cached is not None:
+            return cached
+
+        source = Text(
+            self.plain,
+            style=self.style,
+            end="",
+            tab_size=tab_size,
+            spans=self._user_spans(),
+        )
+        lines = source.wrap(
+            console,
+            width,
+            justify="default",
+            overflow=overflow,
+            tab_size=tab_size or 8,
+            no_wrap=no_wrap,
+        )
+        self.color_lines(lines)
+        lines.justify(console, width, justify=justify, overflow=overflow)
+        for line in lines:
+            line.truncate(width, overflow=overflow)
+        text = Text("\n").join(lines)
+        if color_system is not None:
+            text.spans = quantize_spans(text.spans, color_system)
+
+        if len(self._line_cache) >= LINE_CACHE_SIZE:
+            del self._line_cache[next(iter(self._line_cache))]
+        self._line_cache[key] = text
+        return text
+
+    def color_lines(self, lines: Iterable[Text]) -> None:
+        """Apply the gradient to wrapped lines, in place.
+
+        In "line" mode every line gets the full gradient. In "block" mode the \
+gradient runs across all of the lines. Trailing whitespace is not colored.
+
+        Args:
+            lines (Iterable[Text]): The wrapped lines.
+        """
+        lines = list(lines)
+        style = self._base_style()
+        lengths = [len(line.plain.rstrip()) for line in lines]
+        if self.wrap_gradient == "block":
+            ramp = self.color_ramp(sum(lengths))
+            offsets = np.cumsum([0, *lengths]).tolist()
+            ramps = [ramp[start:end] for start, end in zip(offsets, offsets[1:])]
         else:
-            raise TypeError(f"Text must be a string or list, not {type(self.text)}")
+            ramps = [self.color_ramp(length) for length in lengths]
+        for line, ramp in zip(lines, ramps):
+            line.spans = (
+                ramp_spans(
+                    ramp, style, merge=self.merge_spans, background=self.background
+                )
+                + line.spans
+            )
 
-        # split the text into substrings
-        for index, (start, end) in enumerate(slices, 1):  # type: ignore
-            substring = text[start:end]
-            substrings.append(substring)
-        return substrings
+    def generate_indexes(self) -> List[List[int]]:
+        """Chunk the text's character indexes into one list per part.
+
+        Returns:
+            List[List[int]]: The indexes of each part, as in \
+`substring_offsets()`.
+        """
+        return [list(range(start, end)) for start, end in self.substring_offsets()]
+
+    def substring_offsets(self) -> List[Tuple[int, int]]:
+        """Split the text into one part per pair of neighboring colors.
+
+        The parts are near-equal, as `np.array_split` splits them, but only \
+their start and end offsets are computed.
+
+        Returns:
+            List[Tuple[int, int]]: The start and end offset of each part.
+        """
+        sections = self.hues - 1
+        size, extra = divmod(self._length, sections)
+        offsets: List[Tuple[int, int]] = []
+        start = 0
+        for section in range(sections):
+            end = start + size + (1 if section < extra else 0)
+            offsets.append((start, end))
+            start = end
+        return offsets
+
+    def generate_substrings(
+        self, indexes: Optional[List[List[int]]] = None
+    ) -> List[str]:
+        """Split the text into substrings based on the indexes.
+
+        Args:
+            indexes (List[List[int]], optional): The indexes to split the text \
+on. Defaults to None, which splits it at `substring_offsets()`.
+
+        Returns:
+            List[str]: The list of substrings.
+        """
+        if indexes is None:
+            slices = self.substring_offsets()
+        else:
+            slices = [
+                (index[0], index[-1] + 1) if index else (0, 0) for index in indexes
+            ]
+        text = self.plain
+        return [text[start:end] for start, end in slices]
 
     def generate_subgradients(self, substrings: List[str]) -> List[SimpleGradient]:
         """Generate simple gradients.
@@ -410,7 +1066,6 @@ class Gradient(Text):
                 style=self.style,
                 no_wrap=self.no_wrap or False,
                 end=self.end or "\n",
-                spans=self.spans,
             )
 
             subgradients.append(gradient)
@@ -590,6 +1245,83 @@ until it returns to it's starting color.",
         Gradient.rainbow_gradient_example(True)
 
 
+class GradientView(Text):
+    """A `Text` view of a gradient, as `Gradient.__rich__` hands it to rich.
+
+    Joined by `Console.print`, its spans are built from the gradient on \
+first read and kept on the view only, so a gradient holding compact spans \
+stays compact. Rendered on its own, e.g. inside a panel, it renders through \
+`Gradient.__rich_console__`.
+
+    Args:
+        gradient (Gradient): The gradient to view.
+    """
+
+    __slots__ = ("gradient", "_spans_pending")
+
+    _spans = DeferredSpans()
+
+    def __init__(self, gradient: Gradient) -> None:
+        super().__init__(
+            gradient.plain,
+            style=gradient.style,
+            justify=gradient.justify,
+            overflow=gradient.overflow,
+            no_wrap=gradient.no_wrap,
+            end=gradient.end,
+            tab_size=gradient.tab_size,
+        )
+        self.gradient = gradient
+        self._spans_pending = True
+
+    def generate_spans(self) -> List[Span]:
+        """The gradient's spans with its other spans on top, as stored."""
+        gradient = self.gradient
+        return gradient._gradient_span_list() + gradient._user_spans()
+
+    def __rich_console__(
+        self, console: Console, options: ConsoleOptions
+    ) -> Iterable[Segment]:
+        yield from self.gradient._render(console, options, self.end)
+
+    def __rich_measure__(
+        self, console: Console, options: ConsoleOptions
+    ) -> Measurement:
+        return self.gradient.__rich_measure__(console, options)
+
+
+class GradientRenderable:
+    """Render a gradient with its `__rich_console__`, outside of `Text`.
+
+    `Console.print` joins `Text` instances, so a gradient handed to it as a \
+`Text` is never rendered by `Gradient.__rich_console__`. This wrapper is not \
+a `Text`, and is rendered on its own.
+
+    Args:
+        gradient (Gradient): The gradient to render.
+        end (str, optional): The string written after the text. Defaults to \
+None, which uses the gradient's `end`.
+    """
+
+    __slots__ = ("gradient", "end")
+
+    def __init__(self, gradient: Gradient, end: Optional[str] = None) -> None:
+        self.gradient = gradient
+        self.end = end
+
+    def __rich_console__(
+        self, console: Console, options: ConsoleOptions
+    ) -> Iterable[Segment]:
+        gradient = self.gradient
+        end = gradient.end if self.end is None else self.end
+        yield from gradient._render(console, options, end)
+
+    def __rich_measure__(
+        self, console: Console, options: ConsoleOptions
+    ) -> Measurement:
+        return self.gradient.__rich_measure__(console, options)
+
+
 if __name__ == "__main__":  # pragma: no cover
     from rich.console import Console
     from rich.traceback import install as tr_install
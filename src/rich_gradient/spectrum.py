@@ -1,7 +1,10 @@
 from __future__ import annotations
 
-from typing import List, Tuple
+from functools import lru_cache
+from random import Random
+from typing import Iterator, List, Optional, Sequence, Tuple, Union, overload
 
+import numpy as np
 from rich.style import Style
 from rich.table import Table
 from rich.text import Text
@@ -94,7 +97,7 @@ class Spectrum(List[Color]):
         based on the HEX values.
 
         """
-        self.COLORS: List[Color] = [Color(hex) for hex in self.HEX]
+        self.COLORS: List[Color] = list(spectrum_colors())
         super().__init__(self.COLORS)
 
     def __rich__(self) -> Table:
@@ -140,6 +143,207 @@ class Spectrum(List[Color]):
         return table
 
 
+@lru_cache(maxsize=1)
+def spectrum_colors() -> Tuple[Color, ...]:
+    """The `Spectrum`'s colors, parsed once per process and shared.
+
+    Returns:
+        Tuple[Color, ...]: One `Color` per entry of `Spectrum.HEX`.
+    """
+    return tuple(Color(hex) for hex in Spectrum.HEX)
+
+
+SPECTRUM_RGB: np.ndarray = np.array(
+    [[int(hex[index : index + 2], 16) for index in (1, 3, 5)] for hex in Spectrum.HEX],
+    dtype=np.uint8,
+)
+SPECTRUM_RGB.flags.writeable = False
+
+
+class SpectrumView(Sequence[Color]):
+    """An immutable, cyclic view of the spectrum's colors.
+
+    A view is only a start, a length and a direction over the shared, \
+packed `SPECTRUM_RGB` array, so rotating, windowing and reversing it is O(1) \
+and never copies or parses a color. Indexing returns the shared `Color` \
+objects of `spectrum_colors()`.
+
+    Args:
+        start (int): The index of the view's first color in the spectrum. \
+Defaults to 0.
+        length (int, optional): The number of colors. Defaults to None, which \
+covers the whole spectrum.
+        step (int): 1 to walk the spectrum forwards, -1 backwards. Defaults \
+to 1.
+    """
+
+    __slots__ = ("_start", "_length", "_step")
+
+    def __init__(
+        self, start: int = 0, length: Optional[int] = None, step: int = 1
+    ) -> None:
+        size = len(SPECTRUM_RGB)
+        if step not in (1, -1):
+            raise ValueError("The step of a spectrum view must be 1 or -1.")
+        self._start = start % size
+        self._length = size if length is None else length
+        if self._length < 0:
+            raise ValueError("The length of a spectrum view cannot be negative.")
+        self._step = step
+
+    def __len__(self) -> int:
+        return self._length
+
+    def _index(self, index: int) -> int:
+        """The position in the spectrum of the view's color at `index`."""
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("Spectrum view index out of range.")
+        return (self._start + self._step * index) % len(SPECTRUM_RGB)
+
+    @overload
+    def __getitem__(self, index: int) -> Color: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[Color]: ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Color, List[Color]]:
+        colors = spectrum_colors()
+        if isinstance(index, slice):
+            return [colors[self._index(i)] for i in range(*index.indices(self._length))]
+        return colors[self._index(index)]
+
+    def __iter__(self) -> Iterator[Color]:
+        colors = spectrum_colors()
+        return (colors[position] for position in self.indexes().tolist())
+
+    def __repr__(self) -> str:
+        return (
+            f"SpectrumView(start={self._start}, length={self._length}, "
+            f"step={self._step})"
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, SpectrumView):
+            return NotImplemented
+        return np.array_equal(self.indexes(), other.indexes())
+
+    def __hash__(self) -> int:
+        return hash(tuple(self.indexes().tolist()))
+
+    def indexes(self) -> np.ndarray:
+        """The positions in the spectrum of the view's colors.
+
+        Returns:
+            np.ndarray: One index into `SPECTRUM_RGB` per color.
+        """
+        positions = self._start + self._step * np.arange(self._length)
+        return positions % len(SPECTRUM_RGB)
+
+    @property
+    def rgb(self) -> np.ndarray:
+        """The view's colors as an `(n, 3)` array of `uint8` RGB values."""
+        return SPECTRUM_RGB[self.indexes()]
+
+    @property
+    def stops(self) -> Tuple[Tuple[int, int, int], ...]:
+        """The view's colors as hashable RGB stops, like `ramp_stops`."""
+        return tuple(map(tuple, self.rgb.tolist()))  # type: ignore[arg-type]
+
+    def rotate(self, offset: int) -> "SpectrumView":
+        """Start the view `offset` colors further along its direction.
+
+        Args:
+            offset (int): The number of colors to rotate by, wrapping around.
+
+        Returns:
+            SpectrumView: The rotated view.
+        """
+        return SpectrumView(self._start + self._step * offset, self._length, self._step)
+
+    def window(self, start: int, length: int) -> "SpectrumView":
+        """Get `length` consecutive colors from `start`, wrapping around.
+
+        Args:
+            start (int): The offset of the first color within this view.
+            length (int): The number of colors.
+
+        Returns:
+            SpectrumView: The window.
+        """
+        return SpectrumView(self._start + self._step * start, length, self._step)
+
+    def reversed(self) -> "SpectrumView":
+        """Get the view's colors in reverse order.
+
+        Returns:
+            SpectrumView: The reversed view.
+        """
+        last = self._start + self._step * (self._length - 1)
+        return SpectrumView(last, self._length, -self._step)
+
+
+SPECTRUM: SpectrumView = SpectrumView()
+
+
+class RandomGradientSource:
+    """Draw random gradients from the shared spectrum, reproducibly if seeded.
+
+    Each draw picks a random start offset and direction in the spectrum and \
+returns a `SpectrumView`, so no `Color` is ever allocated. Two sources \
+created with the same seed draw the same gradients.
+
+    Args:
+        seed (int | str, optional): The seed of the source's random number \
+generator. Defaults to None, which seeds it from the system.
+    """
+
+    def __init__(self, seed: Union[int, str, None] = None) -> None:
+        self.seed = seed
+        self._random = Random(seed)
+
+    def __repr__(self) -> str:
+        return f"RandomGradientSource(seed={self.seed!r})"
+
+    def reseed(self, seed: Union[int, str, None] = None) -> None:
+        """Restart the source from a new seed.
+
+        Args:
+            seed (int | str, optional): The new seed. Defaults to None.
+        """
+        self.seed = seed
+        self._random.seed(seed)
+
+    def view(self, hues: int) -> SpectrumView:
+        """Draw `hues` consecutive colors of the spectrum.
+
+        Args:
+            hues (int): The number of colors.
+
+        Returns:
+            SpectrumView: The colors, from a random offset in a random \
+direction.
+        """
+        offset = self._random.randrange(len(SPECTRUM_RGB))
+        step = self._random.choice((1, -1))
+        return SpectrumView(offset, hues, step)
+
+    def colors(self, hues: int) -> List[Color]:
+        """Draw `hues` consecutive colors of the spectrum.
+
+        Args:
+            hues (int): The number of colors.
+
+        Returns:
+            List[Color]: The shared `Color` objects of the drawn colors.
+        """
+        return list(self.view(hues))
+
+
+RANDOM_GRADIENTS: RandomGradientSource = RandomGradientSource()
+
+
 if __name__ == "__main__":
     from rich.console import Console
 
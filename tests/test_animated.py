@@ -0,0 +1,44 @@
+from rich.color import ColorSystem
+from rich.console import Console
+
+from rich_gradient._animated import AnimatedGradient
+
+
+def styles(text):
+    return [span.style for span in text.spans]
+
+
+def test_animated_gradient_rotates():
+    animated = AnimatedGradient("Hello, World!", ["red", "blue"])
+    first = styles(animated.frame())
+    animated.advance()
+    second = styles(animated.frame())
+    assert second[1:] == first[:-1]
+    assert second[0] == first[-1]
+    animated.advance(animated.cycle_length - 1)
+    assert styles(animated.frame()) == first
+
+
+def test_animated_gradient_shares_styles():
+    animated = AnimatedGradient("x" * 50, ["red", "blue"], cycle_length=10)
+    spans = animated.frame().spans
+    assert spans[0].style is spans[10].style
+    assert str(spans[0].style) == "#ff0000"
+
+
+def test_animated_gradient_render_advances():
+    console = Console(force_terminal=True, color_system="truecolor", width=40)
+    animated = AnimatedGradient("Hello", ["red", "blue"], speed=2)
+    with console.capture() as capture:
+        console.print(animated)
+    assert animated.phase == 2
+    assert "\x1b[38;2;255;0;0mH" in capture.get()
+
+
+def test_animated_gradient_quantized_table():
+    animated = AnimatedGradient("Hello", ["red", "blue"])
+    text = animated.frame(color_system=ColorSystem.EIGHT_BIT)
+    assert all(span.style.color.number is not None for span in text.spans)
+    assert animated._table(ColorSystem.EIGHT_BIT) is animated._table(
+        ColorSystem.EIGHT_BIT
+    )
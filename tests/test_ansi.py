@@ -0,0 +1,141 @@
+import pytest
+from rich.color import ColorSystem
+from rich.console import Console
+from rich.text import Span, Text
+
+from rich_gradient._ansi import SGR_CACHE, color_sgr
+from rich_gradient.main import Gradient
+
+
+def decoded_colors(ansi):
+    text = Text.from_ansi(ansi)
+    return [
+        text.get_style_at_offset(Console(), index).color for index in range(len(text))
+    ]
+
+
+def test_to_ansi_truecolor_matches_spans():
+    gradient = Gradient("Hello, World!", ["red", "blue"], style="bold")
+    ansi = gradient.to_ansi()
+    assert ansi.startswith("\x1b[1m\x1b[38;2;255;0;0mH")
+    assert ansi.endswith("\x1b[0m")
+    assert [color.triplet for color in decoded_colors(ansi)] == [
+        span.style.color.triplet for span in gradient.spans
+    ]
+
+
+def test_to_ansi_emits_only_changes():
+    gradient = Gradient("x" * 100, ["#000000", "#000004"])
+    ansi = gradient.to_ansi("256")
+    assert ansi.count("\x1b[38;5;16m") == 1
+    assert Text.from_ansi(ansi).plain == "x" * 100
+
+
+@pytest.mark.parametrize("color_system", ["truecolor", "256", "standard"])
+def test_to_ansi_background_matches_spans(color_system):
+    gradient = Gradient("Hello, World!", ["#000000", "#ffffff"], background=True)
+    text = Text.from_ansi(gradient.to_ansi(color_system))
+    console = Console(force_terminal=True, color_system=color_system)
+    rendered = [
+        segment.style
+        for segment in console.render(gradient)
+        for _ in segment.text
+        if segment.style is not None
+    ]
+    decoded = [text.get_style_at_offset(console, index) for index in range(len(text))]
+    assert len(rendered) == len(decoded)
+    for expected_style, style in zip(rendered, decoded):
+        for color, expected in (
+            (style.color, expected_style.color),
+            (style.bgcolor, expected_style.bgcolor),
+        ):
+            assert color.downgrade(console._color_system).get_ansi_codes() == (
+                expected.downgrade(console._color_system).get_ansi_codes()
+            )
+
+
+def test_to_ansi_background_emits_only_changed_colors():
+    gradient = Gradient("x" * 100, ["#000000", "#ffffff"], background=True)
+    ansi = gradient.to_ansi()
+    # The contrasting foreground turns from white to black once.
+    assert ansi.count("38;2;255;255;255") == 1
+    assert ansi.count("38;2;0;0;0") == 1
+    assert ansi.count("48;2;") == len(set(map(tuple, gradient.color_ramp())))
+    assert "\x1b[48;2;" in ansi
+
+
+@pytest.mark.parametrize("background", [False, True])
+def test_to_ansi_colored_style_matches_rich(background):
+    gradient = Gradient(
+        "Hello World", ["#f00", "#00f"], style="red", background=background
+    )
+    console = Console(force_terminal=True, color_system="truecolor", width=80)
+    with console.capture() as capture:
+        console.print(gradient, end="")
+    assert gradient.to_ansi() == capture.get()
+    if not background:
+        assert "38;2;0;0;255" not in gradient.to_ansi()
+
+
+def test_to_ansi_no_color():
+    assert Gradient("Hello", ["red", "blue"]).to_ansi(None) == "Hello"
+
+
+def test_to_ansi_with_user_spans():
+    gradient = Gradient("Hello, World!", ["red", "blue"])
+    gradient.highlight_regex("World", "underline")
+    assert "\x1b[4;38;2;" in gradient.to_ansi()
+
+
+def test_to_ansi_user_spans_survive_right_crop():
+    gradient = Gradient("Hello World", ["#ff0000", "#0000ff"])
+    gradient.stylize("bold", 0, 5)
+    gradient.spans
+    gradient.right_crop(3)
+    assert gradient._user_spans() == [Span(0, 5, "bold")]
+    ansi = gradient.to_ansi()
+    assert ansi.startswith("\x1b[1;38;2;255;0;0mH")
+    assert Text.from_ansi(ansi).plain == "Hello Wo"
+
+
+def test_to_ansi_unknown_color_system():
+    with pytest.raises(ValueError):
+        Gradient("Hello", ["red", "blue"]).to_ansi("16m")
+
+
+def test_color_sgr_cached():
+    SGR_CACHE.clear()
+    assert color_sgr(255, 0, 0, ColorSystem.TRUECOLOR) == "38;2;255;0;0"
+    assert SGR_CACHE.info().currsize == 1
+
+
+@pytest.mark.parametrize("text", ["Hello, World!", "x" * 200])
+def test_fast_print(text):
+    console = Console(force_terminal=True, color_system="truecolor", width=80)
+    gradient = Gradient(text, ["red", "blue"])
+    with console.capture() as capture:
+        gradient.fast_print(console)
+    output = capture.get()
+    assert output.endswith("\n")
+    assert Text.from_ansi(output).plain.replace("\n", "") == text
+    if len(text) <= 80:
+        assert output == gradient.to_ansi() + "\n"
+
+
+@pytest.mark.parametrize(
+    "console",
+    [
+        Console(force_terminal=True, color_system="truecolor", no_color=True),
+        Console(
+            force_terminal=True, color_system="truecolor", _environ={"NO_COLOR": "1"}
+        ),
+    ],
+)
+def test_fast_print_no_color(console):
+    gradient = Gradient("Hello, World!", ["red", "blue"], style="bold")
+    with console.capture() as capture:
+        gradient.fast_print(console)
+    output = capture.get()
+    assert "38;" not in output
+    assert "\x1b[1m" in output
+    assert Text.from_ansi(output).plain == "Hello, World!"
@@ -0,0 +1,118 @@
+import pytest
+from rich.console import Console
+from rich.segment import Segment
+
+from rich_gradient._border import (
+    BORDER_CACHE,
+    BORDER_SEGMENT_CACHE,
+    GradientPanel,
+    GradientRule,
+    GradientTable,
+    border_styles,
+    perimeter_index,
+    perimeter_length,
+)
+
+
+def render_lines(renderable, width=20):
+    console = Console(width=width, color_system="truecolor", force_terminal=True)
+    return list(Segment.split_lines(console.render(renderable)))
+
+
+def color_at(line, column):
+    for segment in line:
+        if column < segment.cell_length:
+            color = segment.style.color if segment.style else None
+            return color.triplet if color else None
+        column -= segment.cell_length
+    raise IndexError(column)
+
+
+def test_perimeter_runs_clockwise():
+    width, height = 5, 4
+    indexes = [
+        perimeter_index(row, column, width, height)
+        for row, column in [(0, 0), (0, 4), (1, 4), (2, 4), (3, 4), (3, 0), (2, 0)]
+    ]
+    assert indexes == [0, 4, 5, 6, 7, 11, 12]
+    assert perimeter_length(width, height) == 14
+    assert perimeter_index(1, 0, width, height) == 13
+    assert perimeter_length(7, 1) == 7
+
+
+def test_border_styles_are_cached():
+    stops = ((255, 0, 0), (0, 0, 255))
+    styles = border_styles(stops, 9, 5)
+    assert len(styles) == perimeter_length(9, 5)
+    assert border_styles(stops, 9, 5) is styles
+    assert (stops, 9, 5, "rgb") in BORDER_CACHE
+
+
+def test_gradient_panel_colors_the_border():
+    lines = render_lines(GradientPanel("hello", ["#ff0000", "#0000ff"]))
+    assert len(lines) == 3
+    assert tuple(color_at(lines[0], 0)) == (255, 0, 0)
+    # The gradient comes back around to the top left corner.
+    assert color_at(lines[1], 0)[2] > 200
+    assert color_at(lines[1], 19)[0] > color_at(lines[1], 0)[0]
+    # The content is left alone.
+    assert color_at(lines[1], 2) is None
+    assert "".join(segment.text for segment in lines[1]) == "│ hello            │"
+
+
+def test_gradient_panel_keeps_title_colors():
+    panel = GradientPanel("hello", ["#ff0000", "#0000ff"], title="[#00ff00]Title")
+    top = render_lines(panel)[0]
+    title = [segment for segment in top if segment.text == "Title"]
+    assert tuple(title[0].style.color.triplet) == (0, 255, 0)
+    assert all(not segment.style.meta for segment in top)
+
+
+def test_gradient_panel_reuses_border_segments():
+    panel = GradientPanel("hello", ["#123456", "#654321"])
+    render_lines(panel)
+    hits = BORDER_SEGMENT_CACHE.hits
+    render_lines(panel)
+    assert BORDER_SEGMENT_CACHE.hits > hits
+
+
+def test_nested_gradient_panels():
+    inner = GradientPanel("x", ["#ff0000", "#0000ff"])
+    outer = GradientPanel(inner, ["#00ff00", "#ffff00"])
+    lines = render_lines(outer)
+    # The inner panel keeps its own colors.
+    assert tuple(color_at(lines[1], 2)) == (255, 0, 0)
+
+
+def test_gradient_rule():
+    line = render_lines(GradientRule(colors=["#ff0000", "#0000ff"]))[0]
+    assert tuple(color_at(line, 0)) == (255, 0, 0)
+    assert color_at(line, 19)[2] > 200
+
+    titled = render_lines(GradientRule("Title", ["#ff0000", "#0000ff"]))[0]
+    assert "Title" in "".join(segment.text for segment in titled)
+
+
+def test_gradient_table():
+    table = GradientTable("a", "b", colors=["#ff0000", "#0000ff"], title="T")
+    table.add_row("1", "2")
+    lines = render_lines(table)
+    # The title is not part of the border.
+    assert color_at(lines[0], 4) is None
+    assert tuple(color_at(lines[1], 0)) == (255, 0, 0)
+    # Lines between columns take the color of the top border above them.
+    assert color_at(lines[2], 4) == color_at(lines[1], 4)
+
+
+def test_gradient_border_needs_two_colors():
+    with pytest.raises(ValueError):
+        GradientPanel("hello", ["#ff0000"])
+
+
+def test_gradient_panel_on_palette_console():
+    console = Console(width=20, color_system="256", force_terminal=True)
+    lines = list(Segment.split_lines(console.render(GradientPanel("hi"))))
+    assert all(
+        segment.style.color.is_system_defined or segment.style.color.number is not None
+        for segment in lines[0]
+    )
@@ -0,0 +1,102 @@
+import pytest
+from rich.style import Style
+
+from rich_gradient._cache import CacheInfo, LRUCache
+from rich_gradient._lazy import compact_spans
+from rich_gradient._ramp import (
+    RAMP_CACHE,
+    STYLE_CACHE,
+    cached_ramp,
+    color_style,
+    configure_ramp_cache,
+    warm_ramp_cache,
+)
+from rich_gradient.main import Gradient
+
+
+def test_lru_cache_counts_and_evicts():
+    cache: LRUCache[int] = LRUCache(maxsize=2)
+    assert cache.get("a") is None
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+    assert "b" not in cache
+    assert cache.info() == CacheInfo(hits=1, misses=1, maxsize=2, currsize=2)
+
+
+def test_lru_cache_resize():
+    cache: LRUCache[int] = LRUCache(maxsize=4)
+    for index in range(4):
+        cache.set(index, index)
+    cache.resize(2)
+    assert len(cache) == 2
+    assert 3 in cache and 0 not in cache
+    with pytest.raises(ValueError):
+        cache.resize(0)
+
+
+def test_lru_cache_get_or_set():
+    cache: LRUCache[int] = LRUCache()
+    assert cache.get_or_set("a", lambda: 1) == 1
+    assert cache.get_or_set("a", lambda: 2) == 1
+    cache.clear()
+    assert cache.info() == CacheInfo(0, 0, 1024, 0)
+
+
+def test_color_style_is_interned():
+    bold = Style(bold=True)
+    assert color_style(1, 2, 3, bold) is color_style(1, 2, 3, bold)
+    assert str(color_style(1, 2, 3, bold)) == "bold #010203"
+
+
+def test_gradients_share_styles():
+    STYLE_CACHE.clear()
+    first = Gradient("Hello, World!", ["red", "blue"])
+    misses = STYLE_CACHE.info().misses
+    second = Gradient("Hello, World!", ["red", "blue"])
+    assert STYLE_CACHE.info().misses == misses
+    assert STYLE_CACHE.info().hits >= len(second)
+    palette = compact_spans(first).palette
+    assert all(
+        style1 is style2
+        for style1, style2 in zip(palette, compact_spans(second).palette)
+    )
+    # Stored spans hold copies private to each gradient.
+    assert first.spans == second.spans
+    assert not {id(style) for style in palette} & {
+        id(span.style) for span in first.spans
+    }
+
+
+def test_cached_ramp_reused():
+    RAMP_CACHE.clear()
+    stops = ((255, 0, 0), (0, 0, 255))
+    ramp = cached_ramp(stops, 10)
+    assert not ramp.flags.writeable
+    assert cached_ramp(stops, 10) is ramp
+    assert RAMP_CACHE.info().hits == 1
+    assert cached_ramp(stops, 11) is not ramp
+
+
+def test_cached_ramp_max_length():
+    RAMP_CACHE.clear()
+    configure_ramp_cache(max_length=5)
+    try:
+        cached_ramp(((0, 0, 0), (255, 255, 255)), 6)
+        assert len(RAMP_CACHE) == 0
+    finally:
+        configure_ramp_cache(max_length=65536)
+
+
+def test_warm_ramp_cache():
+    RAMP_CACHE.clear()
+    warm_ramp_cache(["red", "blue"], range(1, 11))
+    assert len(RAMP_CACHE) == 10
+    Gradient("Hello", ["red", "blue"])
+    assert RAMP_CACHE.info().hits == 1
+
+
+def test_cached_ramp_unknown_interpolation():
+    with pytest.raises(ValueError):
+        cached_ramp(((0, 0, 0), (255, 255, 255)), 4, "hsv")  # type: ignore
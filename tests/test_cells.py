@@ -0,0 +1,50 @@
+import numpy as np
+from rich.cells import cell_len
+
+from rich_gradient._cells import cell_columns
+from rich_gradient.main import Gradient
+
+
+def test_cell_columns_ascii():
+    columns, width = cell_columns("Hello")
+    assert columns.tolist() == [0, 1, 2, 3, 4]
+    assert width == 5
+
+
+def test_cell_columns_wide_characters():
+    columns, width = cell_columns("a日本b")
+    assert columns.tolist() == [0, 1, 3, 5]
+    assert width == cell_len("a日本b") == 6
+
+
+def test_cell_columns_grapheme_clusters():
+    # e + combining acute, woman + ZWJ + laptop, thumbs up + skin tone, the
+    # flags of the US and the UK, and a lone regional indicator.
+    text = (
+        "e\u0301x\U0001f469\u200d\U0001f4bby\U0001f44d\U0001f3fdz"
+        "\U0001f1fa\U0001f1f8\U0001f1ec\U0001f1e7\U0001f1faw"
+    )
+    columns, width = cell_columns(text)
+    assert columns.tolist() == [0, 0, 1, 2, 2, 2, 4, 5, 5, 7, 8, 8, 10, 10, 12, 13]
+    assert width == 14
+    assert cell_columns("\U0001f1fa\U0001f1f8x")[0].tolist() == [0, 0, 2]
+
+
+def test_gradient_distribute_cells():
+    text = "ab日本語cd"
+    gradient = Gradient(text, ["#ff0000", "#0000ff"], distribute="cells")
+    indexed = Gradient(text, ["#ff0000", "#0000ff"])
+    assert gradient.spans[0].style == indexed.spans[0].style
+    columns, width = cell_columns(text)
+    assert width == 10
+    ramp = indexed._index_ramp(width)
+    assert [span.style.color.triplet for span in gradient.spans] == [
+        tuple(rgb) for rgb in ramp[columns].tolist()
+    ]
+
+
+def test_gradient_distribute_cells_single_color_per_cluster():
+    gradient = Gradient("é́x", ["red", "blue"], distribute="cells")
+    styles = [span.style for span in gradient.spans]
+    assert styles[0] == styles[1] == styles[2] != styles[3]
+    assert np.array_equal(gradient.color_ramp()[0], gradient.color_ramp()[2])
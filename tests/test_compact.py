@@ -0,0 +1,95 @@
+import numpy as np
+import pytest
+from rich.color import ColorSystem
+from rich.console import Console
+from rich.style import Style
+from rich.text import Text
+
+from rich_gradient._compact import CompactSpans
+from rich_gradient._lazy import compact_spans, raw_spans
+from rich_gradient._ramp import generate_ramp, quantize_spans, ramp_spans
+from rich_gradient.main import Gradient
+
+STOPS = np.array([(255, 0, 0), (0, 255, 0), (0, 0, 255)])
+
+
+@pytest.mark.parametrize("merge", [False, True])
+@pytest.mark.parametrize("background", [False, True])
+def test_compact_spans_match_ramp_spans(merge, background):
+    ramp = generate_ramp(STOPS, 40)
+    style = Style(bold=True)
+    compact = CompactSpans.from_ramp(ramp, style, merge, 3, background)
+    expected = ramp_spans(ramp, style, merge, 3, background)
+    spans = compact.to_spans()
+    assert spans == expected
+    assert all(a.style is b.style for a, b in zip(spans, expected))
+    assert len(compact) == len(expected)
+    assert compact.nbytes == 12 * len(expected)
+
+
+def test_compact_spans_concatenate():
+    ramp = generate_ramp(STOPS, 10)
+    head = CompactSpans.from_ramp(ramp[:4], Style.null())
+    tail = CompactSpans.from_ramp(ramp[3:], Style.null(), offset=4)
+    joined = head.concatenate(tail)
+    assert joined.to_spans() == head.to_spans() + tail.to_spans()
+    assert len(joined.palette) == len(set(joined.palette))
+    assert CompactSpans.empty().concatenate(head).to_spans() == head.to_spans()
+
+
+@pytest.mark.parametrize("background", [False, True])
+def test_compact_spans_quantize(background):
+    ramp = generate_ramp(STOPS, 200)
+    compact = CompactSpans.from_ramp(ramp, Style(bold=True), background=background)
+    quantized = compact.quantize(ColorSystem.EIGHT_BIT)
+    expected = quantize_spans(compact.to_spans(), ColorSystem.EIGHT_BIT)
+    assert quantized.to_spans() == expected
+    assert len(quantized) < len(compact)
+    assert compact.quantize(ColorSystem.EIGHT_BIT) is quantized
+
+
+def test_gradient_keeps_spans_compact():
+    gradient = Gradient("Hello, World!", ["red", "blue"])
+    assert compact_spans(gradient) is not None
+    assert raw_spans(gradient) == []
+    console = Console(width=40, force_terminal=True, color_system="256")
+    segments = list(console.render(gradient))
+    assert segments[0].style.color.number == 196
+    # Rendering builds the spans for the render only.
+    assert compact_spans(gradient) is not None
+    assert len(gradient.spans) == 13
+    assert compact_spans(gradient) is None
+    assert not gradient._spans_pending
+
+
+def test_gradient_print_keeps_spans_compact():
+    gradient = Gradient("x" * 10_000, ["red", "blue"])
+    console = Console(width=80, force_terminal=True, color_system="truecolor")
+    with console.capture() as capture:
+        console.print(gradient)
+    assert capture.get().startswith("\x1b[38;2;255;0;0mx")
+    assert compact_spans(gradient) is not None
+    assert gradient._spans_pending
+    assert raw_spans(gradient) == []
+
+
+def test_gradient_compact_append_text():
+    gradient = Gradient("Hello", ["#ff0000", "#0000ff"])
+    gradient.append_text(Text(", World!", style="bold"))
+    assert compact_spans(gradient) is not None
+    eager = Gradient("Hello", ["#ff0000", "#0000ff"])
+    eager.spans
+    eager.append_text(Text(", World!", style="bold"))
+    assert gradient.spans == eager.spans
+
+    rescaled = Gradient("Hello", ["red", "blue"])
+    rescaled.append_text(", World!", rescale=True)
+    assert rescaled.spans == Gradient("Hello, World!", ["red", "blue"]).spans
+
+
+def test_gradient_compact_user_spans():
+    gradient = Gradient("Hello, World!", ["red", "blue"])
+    gradient.highlight_regex("World", "bold")
+    assert compact_spans(gradient) is None
+    assert gradient.spans[-1].style == "bold"
+    assert len(gradient.merged_spans()) == 13
@@ -0,0 +1,505 @@
+import copy
+
+import numpy as np
+import pytest
+from rich.color import ColorSystem, ColorType
+from rich.console import Console
+from rich.panel import Panel
+from rich.style import Style
+from rich.text import Span, Text
+
+from rich_gradient._ramp import (
+    DEFAULT_HUES,
+    HUE_WHEEL,
+    LUT_CACHE,
+    LUT_SIZE,
+    batch_ramps,
+    contrast_mask,
+    downgrade_styles,
+    generate_ramp,
+    gradient_stops,
+    oklab_to_rgb,
+    pair_lut,
+    quantize_spans,
+    rainbow_ramp,
+    rainbow_window,
+    ramp_spans,
+    ramp_stops,
+    rgb_to_oklab,
+)
+from rich_gradient._quantize import install_quantizer
+from rich_gradient._simple_gradient import SimpleGradient
+from rich_gradient.color import Color
+from rich_gradient.main import Gradient
+from rich_gradient.spectrum import spectrum_colors
+
+
+def reference_ramp(stops, length):
+    """Per-character interpolation as done by the original chunked pipeline."""
+    colors = []
+    for index, chunk in enumerate(np.array_split(np.arange(length), len(stops) - 1)):
+        (r1, g1, b1), (r2, g2, b2) = stops[index], stops[index + 1]
+        for position in range(len(chunk)):
+            blend = position / len(chunk)
+            colors.append(
+                (
+                    int(r1 + (r2 - r1) * blend),
+                    int(g1 + (g2 - g1) * blend),
+                    int(b1 + (b2 - b1) * blend),
+                )
+            )
+    return colors
+
+
+@pytest.mark.parametrize("length", [1, 2, 7, 44, 97, 1000])
+@pytest.mark.parametrize(
+    "stops",
+    [
+        [(255, 0, 0), (0, 0, 255)],
+        [(255, 0, 255), (175, 0, 255), (95, 0, 255)],
+        [(255, 0, 0), (0, 255, 0), (0, 0, 255), (0, 255, 255), (255, 255, 0)],
+    ],
+)
+def test_generate_ramp_matches_reference(stops, length):
+    ramp = generate_ramp(np.array(stops), length)
+    assert ramp.shape == (length, 3)
+    assert [tuple(rgb) for rgb in ramp.tolist()] == reference_ramp(stops, length)
+
+
+def test_generate_ramp_empty():
+    assert generate_ramp(np.array([(0, 0, 0), (255, 255, 255)]), 0).shape == (0, 3)
+
+
+def test_generate_ramp_requires_two_stops():
+    with pytest.raises(ValueError):
+        generate_ramp(np.array([(0, 0, 0)]), 10)
+
+
+def test_ramp_stops():
+    stops = ramp_stops([Color("red"), Color("#00ff00")])
+    assert stops == ((255, 0, 0), (0, 255, 0))
+
+
+def test_ramp_spans_share_styles():
+    ramp = np.array([(255, 0, 0), (255, 0, 0), (0, 0, 255)], dtype=np.uint8)
+    spans = ramp_spans(ramp, Style(bold=True))
+    assert [(span.start, span.end) for span in spans] == [(0, 1), (1, 2), (2, 3)]
+    assert spans[0].style is spans[1].style
+    assert str(spans[2].style) == "bold #0000ff"
+
+
+def test_gradient_spans():
+    text = "The quick brown fox jumps over the lazy dog."
+    gradient = Gradient(text, colors=["magenta", "purple", "violet"], style="bold")
+    assert len(gradient.spans) == len(text)
+    assert str(gradient.spans[0].style) == "bold #ff00ff"
+    assert gradient.hues == 3
+
+
+def test_gradient_two_colors():
+    gradient = Gradient("Hello, World!", colors=["red", "blue"])
+    assert gradient.hues == 2
+    assert str(gradient.spans[0].style) == "#ff0000"
+
+
+def test_simple_gradient_spans():
+    gradient = SimpleGradient("Hello", color1="red", color2="blue")
+    assert [str(span.style) for span in gradient.spans] == [
+        "#ff0000",
+        "#cc0033",
+        "#990066",
+        "#660099",
+        "#3300cc",
+    ]
+
+
+def test_ramp_spans_merge():
+    ramp = np.array(
+        [(255, 0, 0), (255, 0, 0), (0, 0, 255), (0, 0, 255), (255, 0, 0)],
+        dtype=np.uint8,
+    )
+    spans = ramp_spans(ramp, Style.null(), merge=True)
+    assert [(span.start, span.end) for span in spans] == [(0, 2), (2, 4), (4, 5)]
+    assert spans[0].style is spans[2].style
+
+
+def test_gradient_merge_spans():
+    text = "x" * 200
+    merged = Gradient(text, colors=["#000000", "#000010"], merge_spans=True)
+    plain = Gradient(text, colors=["#000000", "#000010"])
+    assert len(merged.spans) == 16
+    assert len(plain.spans) == 200
+    assert merged.spans[0].start == 0 and merged.spans[-1].end == 200
+    for span in merged.spans:
+        for index in range(span.start, span.end):
+            assert plain.spans[index].style == span.style
+
+
+def test_simple_gradient_merge_spans():
+    gradient = SimpleGradient(
+        "x" * 50, color1="#000000", color2="#000005", merge_spans=True
+    )
+    assert len(gradient.spans) == 5
+
+
+@pytest.mark.parametrize("color_system", ["standard", "256"])
+def test_gradient_quantized_render(color_system):
+    console = Console(force_terminal=True, color_system=color_system, width=80)
+    gradient = Gradient("The quick brown fox jumps over the lazy dog.", ["red", "blue"])
+    segments = [
+        segment
+        for segment in gradient.__rich_console__(console, console.options)
+        if segment.text.strip()
+    ]
+    assert "".join(segment.text for segment in segments).startswith("The quick")
+    assert len(segments) < len(gradient.spans)
+    for segment in segments:
+        assert segment.style.color.type != ColorType.TRUECOLOR
+
+
+def test_gradient_quantized_print():
+    console = Console(force_terminal=True, color_system="256", width=80)
+    with console.capture() as capture:
+        Gradient("hello world", ["red", "blue"]).fast_print(console)
+    output = capture.get()
+    assert Text.from_ansi(output).plain == "hello world"
+    # Neighboring characters on the same palette entry share one sequence.
+    assert output.count("\x1b[38;5;") < len("hello world")
+    assert "38;2;" not in output
+
+
+@pytest.mark.parametrize("justify", [None, "center"])
+def test_gradient_quantized_console_print(justify):
+    console = Console(force_terminal=True, color_system="256", width=80)
+    text = Text.assemble(("plain", Style(color="#00ff00")))
+    spans = list(text.spans)
+    install_quantizer(console)
+    with console.capture() as capture:
+        console.print(Gradient("hello world", ["red", "blue"]), text, justify=justify)
+    output = capture.get()
+    assert Text.from_ansi(output).plain.strip() == "hello world plain"
+    assert output.count("\x1b[38;5;") < len("hello world")
+    assert "38;2;" not in output
+    assert text.spans == spans
+
+
+def test_gradient_truecolor_render_untouched():
+    console = Console(force_terminal=True, color_system="truecolor", width=80)
+    gradient = Gradient("Hello, World!", ["red", "blue"])
+    segments = list(gradient.__rich_console__(console, console.options))
+    assert [segment.style for segment in segments[:13]] == [
+        span.style for span in gradient.spans
+    ]
+
+
+def test_quantize_spans_merges_palette_runs():
+    spans = [
+        Span(0, 1, Style(color="#ff0000")),
+        Span(1, 2, Style(color="#fe0101")),
+        Span(2, 3, Style(color="#0000ff")),
+    ]
+    quantized = quantize_spans(spans, ColorSystem.EIGHT_BIT)
+    assert [(span.start, span.end) for span in quantized] == [(0, 2), (2, 3)]
+
+
+def test_downgrade_styles_once_per_style():
+    red = Style(bold=True, color="#ff0000", bgcolor="#0000ff")
+    plain = Style(italic=True)
+    downgraded = downgrade_styles([red, plain, red], ColorSystem.EIGHT_BIT)
+    assert downgraded[0] is downgraded[2]
+    assert downgraded[0].color.number == 196
+    assert downgraded[0].bgcolor.number == 21
+    assert downgraded[0].bold
+    assert downgraded[1] is plain
+
+
+def test_gradient_stops():
+    assert [color.hex for color in gradient_stops(["red", "blue"])] == ["#f00", "#00f"]
+    assert len(gradient_stops(None)) == DEFAULT_HUES
+    with pytest.raises(ValueError):
+        gradient_stops(["red"])
+
+
+def test_gradient_lazy_spans(mocker):
+    generate = mocker.spy(Gradient, "generate_spans")
+    gradient = Gradient("Hello, World!", ["red", "blue"], lazy=True)
+    assert generate.call_count == 0
+    assert gradient.spans == Gradient("Hello, World!", ["red", "blue"]).spans
+    # The eager gradient builds its spans from compact storage instead.
+    assert generate.call_count == 1
+    gradient.spans
+    assert generate.call_count == 1
+
+
+def test_gradient_lazy_print():
+    console = Console(force_terminal=True, color_system="truecolor", width=80)
+    with console.capture() as capture:
+        console.print(Gradient("Hello", ["red", "blue"], lazy=True))
+    assert "\x1b[38;2;255;0;0mH" in capture.get()
+
+
+def test_gradient_print_end():
+    console = Console(force_terminal=True, color_system="truecolor", width=80)
+    with console.capture() as capture:
+        console.print(Gradient("hello", ["#ff0000", "#0000ff"]), end="")
+        console.print("|")
+    output = capture.get()
+    assert Text.from_ansi(output).plain == "hello|"
+    assert output.count("\n") == 1
+    assert output.startswith("\x1b[38;2;255;0;0mh")
+
+
+def test_gradient_print_joins_arguments():
+    console = Console(force_terminal=True, color_system="truecolor", width=80)
+    first = Gradient("ab", ["#ff0000", "#0000ff"])
+    second = Gradient("cd", ["#00ff00", "#0000ff"])
+    with console.capture() as capture:
+        console.print(first, second)
+        console.print(first, "tail", sep="-")
+    output = capture.get()
+    assert Text.from_ansi(output).plain == "ab cd\nab-tail"
+    assert "\x1b[38;2;0;255;0mc" in output
+
+
+def test_gradient_lazy_highlight():
+    gradient = Gradient("Hello, World!", ["red", "blue"], lazy=True)
+    gradient.highlight_regex("World", "bold")
+    assert len(gradient.spans) == 14
+    assert gradient.spans[-1] == Span(7, 12, "bold")
+
+
+def test_simple_gradient_lazy_spans():
+    gradient = SimpleGradient("Hello", color1="red", color2="blue", lazy=True)
+    assert gradient._spans_pending
+    assert len(gradient.spans) == 5
+    assert not gradient._spans_pending
+
+
+def wrapped_colors(gradient, width):
+    console = Console(force_terminal=True, color_system="truecolor", width=width)
+    text = gradient.wrapped_text(console, console.options)
+    colors = []
+    offset = 0
+    for line in text.plain.split("\n"):
+        colors.append(
+            [
+                tuple(text.get_style_at_offset(console, offset + index).color.triplet)
+                for index in range(len(line.rstrip()))
+            ]
+        )
+        offset += len(line) + 1
+    return text, colors
+
+
+def test_gradient_wrap_line():
+    gradient = Gradient("aaaa bbbb cccc", ["#ff0000", "#0000ff"], wrap_gradient="line")
+    text, lines = wrapped_colors(gradient, 5)
+    assert text.plain.split() == ["aaaa", "bbbb", "cccc"]
+    for colors in lines:
+        assert colors[0] == (255, 0, 0)
+        assert colors == lines[0]
+
+
+def test_gradient_wrap_block():
+    gradient = Gradient("aaaa bbbb", ["#ff0000", "#0000ff"], wrap_gradient="block")
+    text, lines = wrapped_colors(gradient, 5)
+    assert text.plain.split() == ["aaaa", "bbbb"]
+    assert lines[0][0] == (255, 0, 0)
+    assert lines[0] + lines[1] == [
+        tuple(rgb) for rgb in generate_ramp(np.array([(255, 0, 0), (0, 0, 255)]), 8)
+    ]
+
+
+def test_gradient_wrap_cache():
+    console = Console(force_terminal=True, color_system="truecolor", width=20)
+    gradient = Gradient("Hello, World! " * 4, ["red", "blue"], wrap_gradient="line")
+    first = gradient.wrapped_text(console, console.options)
+    assert gradient.wrapped_text(console, console.options) is first
+    assert gradient.wrapped_text(console, console.options.update_width(10)) is not first
+    gradient.highlight_regex("World", "bold")
+    assert gradient.wrapped_text(console, console.options) is not first
+
+
+def printed_lines(renderable, width, color_system="truecolor"):
+    console = Console(force_terminal=True, color_system=color_system, width=width)
+    with console.capture() as capture:
+        console.print(renderable)
+    return capture.get().splitlines()
+
+
+def test_gradient_wrap_line_print():
+    gradient = Gradient(
+        "aaaa bbbb cccc dddd", ["#ff0000", "#0000ff"], wrap_gradient="line"
+    )
+    lines = printed_lines(gradient, 10)
+    assert len(lines) == 2
+    assert lines[0].startswith("\x1b[38;2;255;0;0ma")
+    assert lines[1].startswith("\x1b[38;2;255;0;0mc")
+    # Printed alone, the gradient renders as it does inside a panel.
+    for line, boxed in zip(lines, printed_lines(Panel(gradient), 14)[1:3]):
+        assert line.rstrip() in boxed
+
+
+def test_gradient_wrap_cache_follows_text_and_style():
+    gradient = Gradient("aaaa bbbb", ["#ff0000", "#0000ff"], wrap_gradient="line")
+    assert Text.from_ansi(printed_lines(Panel(gradient), 14)[1]).plain == (
+        "│ aaaa bbbb  │"
+    )
+    gradient.plain = "cccc dddd"
+    assert Text.from_ansi(printed_lines(Panel(gradient), 14)[1]).plain == (
+        "│ cccc dddd  │"
+    )
+    gradient.style = "bold"
+    assert printed_lines(gradient, 14)[0].startswith("\x1b[1;38;2;255;0;0mc")
+
+
+def test_gradient_append_text_keeps_prefix():
+    gradient = Gradient("Hello", ["#ff0000", "#0000ff"])
+    before = list(gradient.spans)
+    gradient.append_text(Text(", World!", style="bold"))
+    assert gradient.plain == "Hello, World!"
+    assert gradient.spans[:5] == before
+    tail = generate_ramp(np.array([(255, 0, 0), (0, 0, 255)]), 13)[5:]
+    assert [span.style.color.triplet for span in gradient.spans[5:13]] == [
+        tuple(rgb) for rgb in tail.tolist()
+    ]
+    assert gradient.spans[-1] == Span(5, 13, "bold")
+
+
+def test_gradient_extend_rescale():
+    gradient = Gradient("Hello", ["red", "blue"])
+    gradient.extend([", ", "World!"], rescale=True)
+    assert gradient.spans == Gradient("Hello, World!", ["red", "blue"]).spans
+
+
+def test_gradient_extend_rescale_copy():
+    gradient = Gradient("Hello", ["red", "blue"])
+    gradient.stylize("bold", 0, 2)
+    copied = copy.deepcopy(gradient)
+    copied.extend([", World!"], rescale=True)
+    expected = Gradient("Hello, World!", ["red", "blue"]).spans
+    assert copied.spans == [*expected, Span(0, 2, "bold")]
+    assert len(gradient) == 5
+
+
+def test_gradient_nested_gradient_spans_kept():
+    inner = Gradient("ab", ["red", "blue"])
+    gradient = Gradient(Text.assemble(inner, " plain"), ["red", "blue"])
+    nested = gradient._user_spans()
+    assert len(nested) == 2
+    assert len(gradient.spans) == len(gradient) + 2
+    assert gradient._user_spans() == nested
+    assert "38;2;127;0;127mb" in gradient.to_ansi()
+    gradient.extend(["!"], rescale=True)
+    assert gradient._user_spans() == nested
+
+
+def test_gradient_append_text_lazy():
+    gradient = Gradient("Hello", ["red", "blue"], lazy=True)
+    gradient.append_text(", World!")
+    assert gradient._spans_pending
+    assert gradient.spans == Gradient("Hello, World!", ["red", "blue"]).spans
+
+
+@pytest.mark.parametrize("merge_spans", [False, True])
+def test_gradient_batch(merge_spans):
+    texts = ["Name", "Description", "", "Name", Text("x" * 97)]
+    gradients = Gradient.batch(texts, ["red", "green", "blue"], merge_spans=merge_spans)
+    assert len(gradients) == len(texts)
+    for text, gradient in zip(texts, gradients):
+        expected = Gradient(text, ["red", "green", "blue"], merge_spans=merge_spans)
+        assert gradient.plain == expected.plain
+        assert gradient.spans == expected.spans
+    assert gradients[1].colors is not gradients[0].colors
+
+
+def test_batch_ramps_matches_generate_ramp():
+    stops = np.array([(255, 0, 0), (0, 255, 0), (0, 0, 255)])
+    ramps = batch_ramps(stops, [5, 0, 44, 5])
+    assert ramps[0] is ramps[3]
+    for ramp, length in zip(ramps, [5, 0, 44, 5]):
+        assert np.array_equal(ramp, generate_ramp(stops, length))
+
+
+@pytest.mark.parametrize("interpolation", ["oklab", "lch"])
+def test_perceptual_ramp_endpoints(interpolation):
+    stops = np.array([(255, 0, 0), (0, 255, 0), (0, 0, 255)])
+    ramp = generate_ramp(stops, 9, interpolation)
+    assert ramp.shape == (9, 3)
+    assert tuple(ramp[0]) == (255, 0, 0)
+    assert tuple(ramp[5]) == (0, 255, 0)
+    assert [tuple(rgb) for rgb in ramp.tolist()] != reference_ramp(stops.tolist(), 9)
+
+
+def test_oklab_round_trip():
+    rgb = np.array([(12, 200, 99), (255, 255, 255), (0, 0, 0), (128, 64, 32)])
+    assert np.array_equal(oklab_to_rgb(rgb_to_oklab(rgb)), rgb)
+
+
+def test_pair_lut_cached():
+    LUT_CACHE.clear()
+    lut = pair_lut((255, 0, 0), (0, 0, 255), "oklab")
+    assert lut.shape == (LUT_SIZE, 3)
+    assert pair_lut((255, 0, 0), (0, 0, 255), "oklab") is lut
+    assert LUT_CACHE.info().hits == 1
+
+
+def test_gradient_interpolation():
+    rgb = Gradient("Hello, World!", ["red", "blue"])
+    oklab = Gradient("Hello, World!", ["red", "blue"], interpolation="oklab")
+    assert oklab.spans[0] == rgb.spans[0]
+    assert oklab.spans[6] != rgb.spans[6]
+    with pytest.raises(ValueError):
+        Gradient("Hello", ["red", "blue"], interpolation="hsv")
+
+
+def test_hue_wheel():
+    assert HUE_WHEEL.shape == (3600, 3)
+    assert tuple(HUE_WHEEL[0]) == (255, 0, 0)
+    assert tuple(HUE_WHEEL[1200]) == (0, 255, 0)
+    assert tuple(HUE_WHEEL[2400]) == (0, 0, 255)
+
+
+def test_rainbow_window_matches_ramp():
+    ramp = rainbow_ramp(100, phase=90, span=720)
+    assert np.array_equal(rainbow_window(100, 40, 60, phase=90, span=720), ramp[40:60])
+    assert tuple(rainbow_ramp(2, phase=0, span=120)[-1]) == (0, 255, 0)
+    assert not rainbow_window(100, 40, 60).flags.writeable
+    assert not rainbow_ramp(0).flags.writeable
+
+
+def test_gradient_rainbow(mocker):
+    spectrum_colors()
+    color = mocker.patch("rich_gradient.spectrum.Color", side_effect=AssertionError)
+    gradient = Gradient("Hello, World!", rainbow=True)
+    assert color.call_count == 0
+    assert tuple(gradient.spans[0].style.color.triplet) == (255, 0, 255)
+    assert len({span.style for span in gradient.spans}) == 13
+    assert Gradient("x", rainbow=True).plain == "x"
+
+
+def test_contrast_mask_matches_get_contrast():
+    ramp = np.array(
+        [(0, 0, 0), (127, 127, 127), (128, 0, 0), (0, 0, 255), (40, 200, 90)],
+        dtype=np.uint8,
+    )
+    black = Color("#000000").rich
+    assert contrast_mask(ramp).tolist() == [
+        Color(tuple(color)).get_contrast() == black for color in ramp.tolist()
+    ]
+
+
+def test_gradient_background():
+    gradient = Gradient("Status", ["#000000", "#ffffff"], background=True)
+    first, last = gradient.spans[0].style, gradient.spans[-1].style
+    assert tuple(first.bgcolor.triplet) == (0, 0, 0)
+    assert tuple(first.color.triplet) == (255, 255, 255)
+    assert min(last.bgcolor.triplet) > 127
+    assert tuple(last.color.triplet) == (0, 0, 0)
+    # The user's style is kept on top of the contrasting foreground.
+    styled = Gradient("Status", ["red", "blue"], background=True, style="bold green")
+    assert styled.spans[0].style.bold
+    assert styled.spans[0].style.color.name == "green"
+    # Appended text continues the background gradient.
+    gradient.append_text("!")
+    assert all(span.style.bgcolor for span in gradient.spans)
@@ -0,0 +1,53 @@
+import pytest
+from rich.console import Console
+
+from rich_gradient._gradient2d import Gradient2D
+
+BLOCK = "#####\n#####\n#####"
+
+
+def colors(gradient, row):
+    return [
+        tuple(span.style.color.triplet) for span in gradient.render_lines()[row].spans
+    ]
+
+
+def test_horizontal_gradient_is_equal_per_row():
+    gradient = Gradient2D(BLOCK, ["#ff0000", "#0000ff"], angle=0)
+    grid = gradient.color_grid(3, 5)
+    assert grid.shape == (3, 5, 3)
+    assert (grid[0] == grid[2]).all()
+    assert grid[0, 0, 0] > grid[0, 4, 0]
+
+
+def test_vertical_gradient_is_equal_per_column():
+    gradient = Gradient2D(BLOCK, ["#ff0000", "#0000ff"], angle=90)
+    grid = gradient.color_grid(3, 5)
+    assert (grid[:, 0] == grid[:, 4]).all()
+    assert grid[0, 0, 0] > grid[2, 0, 0]
+    # Each row is a single color, so it renders as a single span.
+    assert len(gradient.render_lines()[1].spans) == 1
+
+
+def test_corner_gradient():
+    gradient = Gradient2D(BLOCK, corners=["#ff0000", "#00ff00", "#0000ff", "#ffffff"])
+    grid = gradient.color_grid(2, 2)
+    assert tuple(grid[0, 0]) == (159, 63, 63)
+    assert tuple(grid[1, 1]) == (159, 191, 191)
+    with pytest.raises(ValueError):
+        Gradient2D(BLOCK, corners=["red", "blue"])
+
+
+def test_grid_cached_per_size():
+    gradient = Gradient2D(BLOCK, ["red", "blue"], angle=45)
+    assert gradient.color_grid(3, 5) is gradient.color_grid(3, 5)
+    assert gradient.color_grid(3, 4) is not gradient.color_grid(3, 5)
+
+
+def test_render_crops_to_width():
+    console = Console(force_terminal=True, color_system="truecolor", width=3)
+    gradient = Gradient2D("ab日本\ncdef", ["red", "blue"], angle=30)
+    with console.capture() as capture:
+        console.print(gradient)
+    assert len(capture.get().splitlines()) == 2
+    assert [line.plain for line in gradient.render_lines(3)] == ["ab ", "cde"]
@@ -0,0 +1,52 @@
+import pytest
+from rich.console import Console
+from rich.measure import Measurement
+from rich.text import Text
+
+from rich_gradient import _measure
+from rich_gradient._measure import measure_plain
+from rich_gradient._simple_gradient import SimpleGradient
+from rich_gradient.main import Gradient
+
+
+@pytest.mark.parametrize(
+    "plain",
+    [
+        "",
+        "Hello, World!",
+        "one two\nthree",
+        "日本語 テキスト\nwide",
+        "tab\tbed",
+        "esc\x1bape",
+    ],
+)
+def test_measure_plain_matches_rich(plain):
+    console = Console()
+    text = Text(plain)
+    assert measure_plain(text.plain) == text.__rich_measure__(console, console.options)
+
+
+def test_gradient_measure_cached(mocker):
+    console = Console()
+    gradient = Gradient("Hello, World!", ["red", "blue"])
+    measure = mocker.spy(_measure, "measure_plain")
+    first = gradient.__rich_measure__(console, console.options)
+    assert first == Measurement(6, 13)
+    assert gradient.__rich_measure__(console, console.options) is first
+    assert measure.call_count == 1
+
+
+def test_gradient_measure_invalidated():
+    console = Console()
+    gradient = Gradient("Hello", ["red", "blue"])
+    assert gradient.__rich_measure__(console, console.options) == Measurement(5, 5)
+    gradient.append_text(" there, World")
+    assert gradient.__rich_measure__(console, console.options) == Measurement(6, 18)
+    gradient.plain = "Hi, Earth!"
+    assert gradient.__rich_measure__(console, console.options) == Measurement(6, 10)
+
+
+def test_simple_gradient_measure():
+    console = Console()
+    gradient = SimpleGradient("Hello, World!", color1="red", color2="blue")
+    assert gradient.__rich_measure__(console, console.options) == Measurement(6, 13)
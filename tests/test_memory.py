@@ -0,0 +1,52 @@
+import tracemalloc
+
+from rich_gradient.main import Gradient
+
+# CJK characters are not cached by CPython, so a list of them costs an object
+# per character.
+TEXT = "渐变色彩文字" * 10_000
+
+
+def measure(build):
+    """The memory kept by what `build` returns, and the peak while building."""
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        kept = build()
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del kept
+    return current - before, peak - before
+
+
+def test_gradient_text_is_contiguous():
+    gradient = Gradient(TEXT, ["red", "blue"])
+    assert len(gradient._text) == 1
+    assert gradient.text is gradient.text
+    gradient.text = "Hello, World!"
+    assert gradient._text == ["Hello, World!"]
+    gradient.append_text("!")
+    assert gradient.text == "Hello, World!!"
+
+
+def test_gradient_memory_benchmark():
+    Gradient("warm up", ["red", "blue"])
+    per_character, _ = measure(lambda: list(TEXT))
+    _, peak = measure(lambda: Gradient(TEXT, ["red", "blue"], lazy=True))
+    # Creating the gradient never holds a list of its characters.
+    assert peak < per_character / 4
+    kept, _ = measure(lambda: Gradient(TEXT, ["red", "blue"]))
+    # The whole gradient, spans included, is smaller than such a list.
+    assert kept < per_character
+
+
+def test_substring_offsets():
+    gradient = Gradient("abcdefghij", ["red", "green", "blue", "white"])
+    assert gradient.substring_offsets() == [(0, 4), (4, 7), (7, 10)]
+    assert gradient.generate_substrings() == ["abcd", "efg", "hij"]
+    assert gradient.generate_substrings(gradient.generate_indexes()) == [
+        "abcd",
+        "efg",
+        "hij",
+    ]
@@ -0,0 +1,28 @@
+import numpy as np
+import pytest
+from rich.console import Console
+
+from rich_gradient._parallel import render_parallel
+from rich_gradient._ramp import generate_ramp
+
+TEXT = "\n".join(f"Line {index}: the quick brown fox." for index in range(40))
+
+
+@pytest.mark.parametrize("color_system", ["truecolor", "256"])
+def test_render_parallel_matches_serial(color_system):
+    console = Console(width=20, color_system=color_system, force_terminal=True)
+    serial = render_parallel(TEXT, ["red", "blue"], console=console, workers=1)
+    parallel = render_parallel(TEXT, ["red", "blue"], console=console, workers=3)
+    assert parallel == serial
+    assert "\x1b" in parallel
+    assert len(parallel.splitlines()) == 80
+
+
+def test_render_parallel_continuous_colors():
+    console = Console(width=80, color_system="truecolor", force_terminal=True)
+    output = render_parallel(
+        "ab\ncd", ["#ff0000", "#0000ff"], console=console, workers=2
+    )
+    ramp = generate_ramp(np.array([(255, 0, 0), (0, 0, 255)]), 5)
+    red, green, blue = ramp[3].tolist()
+    assert f"\x1b[38;2;{red};{green};{blue}mc" in output
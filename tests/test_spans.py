@@ -0,0 +1,57 @@
+from rich.console import Console
+from rich.style import Style
+from rich.text import Span, Text
+
+from rich_gradient._spans import sweep_spans
+from rich_gradient.main import Gradient
+
+RED = Style(color="red")
+BLUE = Style(color="blue")
+
+
+def render(text, spans):
+    console = Console(force_terminal=True, color_system="truecolor", width=80)
+    copy = Text(text.plain, style=text.style)
+    copy.spans = spans
+    with console.capture() as capture:
+        console.print(copy)
+    return capture.get()
+
+
+def test_sweep_spans_layers_user_spans():
+    gradient = [Span(0, 2, RED), Span(2, 4, BLUE)]
+    user = [Span(1, 3, "bold"), Span(2, 3, "italic")]
+    assert sweep_spans(gradient, user) == [
+        Span(0, 1, RED),
+        Span(1, 2, RED + Style(bold=True)),
+        Span(2, 3, BLUE + Style(bold=True, italic=True)),
+        Span(3, 4, BLUE),
+    ]
+
+
+def test_sweep_spans_merges_equal_neighbors():
+    gradient = [Span(0, 1, RED), Span(1, 2, RED), Span(2, 3, BLUE)]
+    assert sweep_spans(gradient, [Span(0, 2, "bold")]) == [
+        Span(0, 2, RED + Style(bold=True)),
+        Span(2, 3, BLUE),
+    ]
+
+
+def test_sweep_spans_later_spans_win():
+    user = [Span(0, 4, "red"), Span(2, 6, "blue")]
+    assert sweep_spans([], user) == [
+        Span(0, 2, Style(color="red")),
+        Span(2, 6, Style(color="blue")),
+    ]
+
+
+def test_gradient_keeps_user_spans():
+    text = Text.from_markup("Hello, [bold underline]World[/]!")
+    gradient = Gradient(text, ["red", "blue"])
+    gradient.highlight_regex("Hello", "italic")
+    merged = gradient.merged_spans()
+    assert len(merged) == len(gradient)
+    for span in merged:
+        if 7 <= span.start < 12:
+            assert span.style.bold and span.style.underline
+    assert render(gradient, merged) == render(gradient, gradient.spans)
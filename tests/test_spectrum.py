@@ -0,0 +1,74 @@
+import pytest
+
+from rich_gradient.color import Color
+from rich_gradient.main import Gradient
+from rich_gradient.spectrum import (
+    SPECTRUM,
+    SPECTRUM_RGB,
+    RandomGradientSource,
+    Spectrum,
+    SpectrumView,
+    spectrum_colors,
+)
+
+
+def test_spectrum_shares_colors():
+    assert Spectrum()[0] is spectrum_colors()[0]
+    assert list(SPECTRUM) == list(Spectrum())
+    assert SPECTRUM_RGB.shape == (len(Spectrum.HEX), 3)
+    assert not SPECTRUM_RGB.flags.writeable
+
+
+def test_spectrum_view_window_wraps():
+    window = SPECTRUM.window(16, 4)
+    assert len(window) == 4
+    assert window[:] == [SPECTRUM[16], SPECTRUM[17], SPECTRUM[0], SPECTRUM[1]]
+    assert window[-1] is SPECTRUM[1]
+    with pytest.raises(IndexError):
+        window[4]
+
+
+def test_spectrum_view_rotate_and_reverse():
+    rotated = SPECTRUM.rotate(3)
+    assert rotated[0] is SPECTRUM[3]
+    assert rotated.rotate(-3) == SPECTRUM
+    reversed_view = SPECTRUM.window(0, 3).reversed()
+    assert list(reversed_view) == [SPECTRUM[2], SPECTRUM[1], SPECTRUM[0]]
+    assert reversed_view.reversed() == SPECTRUM.window(0, 3)
+    assert reversed_view.stops == ((95, 0, 255), (175, 0, 255), (255, 0, 255))
+
+
+def test_spectrum_view_validation():
+    with pytest.raises(ValueError):
+        SpectrumView(step=2)
+    with pytest.raises(ValueError):
+        SpectrumView(length=-1)
+
+
+def test_random_gradient_source_is_reproducible():
+    first, second = RandomGradientSource(seed=7), RandomGradientSource(seed=7)
+    draws = [first.view(4) for _ in range(10)]
+    assert draws == [second.view(4) for _ in range(10)]
+    assert len(set(draws)) > 1
+    first.reseed(7)
+    assert first.view(4) == draws[0]
+
+
+def test_random_gradient_source_shares_colors():
+    colors = RandomGradientSource(seed=1).colors(3)
+    assert len(colors) == 3
+    assert all(color in spectrum_colors() for color in colors)
+
+
+def test_gradient_random_source():
+    source = RandomGradientSource(seed=3)
+    expected = RandomGradientSource(seed=3).colors(4)
+    assert Gradient("Hello", random_source=source).colors == expected
+
+
+def test_colortitle_seeded():
+    first = Color.colortitle("Title", RandomGradientSource(seed=5))
+    second = Color.colortitle("Title", RandomGradientSource(seed=5))
+    assert first.plain == "Title"
+    assert first.spans == second.spans
+    assert all(span.style.startswith("bold #") for span in first.spans)
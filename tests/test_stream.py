@@ -0,0 +1,61 @@
+import numpy as np
+import pytest
+from rich.segment import Segment
+
+from rich_gradient import stream
+from rich_gradient._ramp import generate_ramp
+from rich_gradient.main import Gradient
+
+
+def segment_colors(segments):
+    colors = []
+    for segment in segments:
+        if segment.style is None:
+            continue
+        colors.extend([tuple(segment.style.color.triplet)] * len(segment.text))
+    return colors
+
+
+def test_stream_known_length_matches_gradient():
+    text = "The quick brown fox jumps over the lazy dog."
+    chunks = [text[index : index + 7] for index in range(0, len(text), 7)]
+    segments = list(stream(chunks, ["red", "blue", "lime"], total_length=len(text)))
+    assert "".join(segment.text for segment in segments) == text
+    gradient = Gradient(text, ["red", "blue", "lime"])
+    assert segment_colors(segments) == [
+        tuple(span.style.color.triplet) for span in gradient.spans
+    ]
+
+
+def test_stream_cycles_without_length():
+    chunks = ["x" * 30] * 4
+    colors = segment_colors(stream(chunks, ["#ff0000", "#0000ff"], cycle_length=40))
+    assert len(colors) == 120
+    assert colors[:40] == colors[40:80]
+    assert colors[0] == (255, 0, 0)
+
+
+def test_stream_past_total_length():
+    colors = segment_colors(stream(["abc", "def"], ["#ff0000", "#0000ff"], 4))
+    assert len(colors) == 6
+    assert colors[3] == colors[4] == colors[5]
+
+
+def test_stream_newlines_unstyled():
+    segments = list(stream(["ab\ncd"], ["red", "blue"], total_length=5))
+    assert Segment.line() in segments
+    assert "".join(segment.text for segment in segments) == "ab\ncd"
+
+
+def test_stream_ansi():
+    output = "".join(stream(["ab"], ["#ff0000", "#0000ff"], 2, ansi=True))
+    assert output == "\x1b[38;2;255;0;0ma\x1b[0m\x1b[38;2;127;0;127mb\x1b[0m"
+    output = "".join(
+        stream(["a" * 10], ["#ff0000", "#fe0000"], 10, ansi=True, color_system="256")
+    )
+    assert output == "\x1b[38;5;196maaaaaaaaaa\x1b[0m"
+
+
+def test_stream_requires_two_colors():
+    with pytest.raises(ValueError):
+        list(stream(["abc"], ["red"]))